@@ -139,6 +139,27 @@ for binding_file in ndi_binding_files:
     binaries.append((str(binding_file), "videocue/ndi_wrapper"))
     print(f"[OK] NDI binding added: {binding_file.name}")
 
+# Pre-generate the dark theme so the app reads a plain QSS file at startup instead of
+# importing qdarkstyle. Icon URLs are rewritten from the qdarkstyle Qt resource module
+# to the "qss_icons:" search path, which videocue.py points at resources/qss_icons.
+try:
+    import shutil
+
+    import qdarkstyle
+
+    dark_qss = qdarkstyle.load_stylesheet(qt_api="pyqt6")
+    Path("resources/dark.qss").write_text(
+        dark_qss.replace(":/qss_icons/", "qss_icons:"), encoding="utf-8"
+    )
+    shutil.copytree(
+        Path(qdarkstyle.__file__).parent / "dark" / "rc",
+        "resources/qss_icons/dark/rc",
+        dirs_exist_ok=True,
+    )
+    print("[OK] Dark stylesheet generated: resources/dark.qss")
+except ImportError:
+    print("WARNING: qdarkstyle not installed. Build will use the default Qt theme.")
+
 # Prepare data files
 datas = [
     ("config_schema.json", "."),
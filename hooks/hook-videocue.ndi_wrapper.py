@@ -1,31 +1,51 @@
 """PyInstaller hook for videocue.ndi_wrapper.
 
 Ensures the local NDI native bindings are collected without importing the
-extension module during analysis.
+extension module during analysis, along with any Numba kernel cache files.
 """
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
-from PyInstaller.utils.hooks import get_package_paths
+from PyInstaller.utils.hooks import collect_data_files, get_package_paths
 
 hiddenimports = ["videocue.ndi_wrapper.NDIlib"]
 
 binaries = []
 
+# Ship any Numba compile cache for the UYVY kernel so frozen builds can skip JIT.
+datas = collect_data_files(
+    "videocue.ndi_wrapper", includes=["__pycache__/*.nbi", "__pycache__/*.nbc"]
+)
+
 _base_path, package_path = get_package_paths("videocue.ndi_wrapper")
 wrapper_dir = Path(package_path)
 
 python_tag = f"cp{sys.version_info.major}{sys.version_info.minor}"
-matching_pyd = sorted(wrapper_dir.glob(f"NDIlib.{python_tag}-*.pyd"))
-all_pyd = sorted(wrapper_dir.glob("NDIlib*.pyd"))
-selected_pyd = matching_pyd if matching_pyd else all_pyd
+matching_prefix = f"NDIlib.{python_tag}-"
+ndi_dll_name = "Processing.NDI.Lib.x64.dll"
+
+# Single directory pass: partition .pyd files by Python tag and spot the DLL.
+matching_pyd: list[str] = []
+all_pyd: list[str] = []
+ndi_dll: str | None = None
+with os.scandir(wrapper_dir) as entries:
+    for entry in entries:
+        name = entry.name
+        if name.startswith("NDIlib") and name.endswith(".pyd"):
+            all_pyd.append(entry.path)
+            if name.startswith(matching_prefix):
+                matching_pyd.append(entry.path)
+        elif name == ndi_dll_name and entry.is_file():
+            ndi_dll = entry.path
+
+selected_pyd = sorted(matching_pyd) if matching_pyd else sorted(all_pyd)
 
 for pyd_file in selected_pyd:
-    binaries.append((str(pyd_file), "videocue/ndi_wrapper"))
+    binaries.append((pyd_file, "videocue/ndi_wrapper"))
 
-ndi_dll = wrapper_dir / "Processing.NDI.Lib.x64.dll"
-if ndi_dll.exists():
-    binaries.append((str(ndi_dll), "videocue/ndi_wrapper"))
+if ndi_dll:
+    binaries.append((ndi_dll, "videocue/ndi_wrapper"))
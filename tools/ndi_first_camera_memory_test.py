@@ -18,6 +18,7 @@ import ctypes
 import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import wintypes
 from pathlib import Path
 
@@ -27,50 +28,59 @@ if str(REPO_ROOT) not in sys.path:
 
 from videocue.controllers import ndi_video  # noqa: E402
 from videocue.models.config_manager import ConfigManager  # noqa: E402
+from videocue.ndi_wrapper._uyvy_numba import numba_available, uyvy_to_rgb_into  # noqa: E402
 from videocue.utils.network_interface import (  # noqa: E402
     get_network_interfaces,
     get_preferred_interface_ip,
 )
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
 
-class PROCESS_MEMORY_COUNTERS_EX(ctypes.Structure):  # noqa: N801
-    _fields_ = [
-        ("cb", wintypes.DWORD),
-        ("PageFaultCount", wintypes.DWORD),
-        ("PeakWorkingSetSize", ctypes.c_size_t),
-        ("WorkingSetSize", ctypes.c_size_t),
-        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
-        ("QuotaPagedPoolUsage", ctypes.c_size_t),
-        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
-        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
-        ("PagefileUsage", ctypes.c_size_t),
-        ("PeakPagefileUsage", ctypes.c_size_t),
-        ("PrivateUsage", ctypes.c_size_t),
-    ]
+# Lower bound for the adaptive recv_capture_v3 timeout
+ADAPTIVE_TIMEOUT_MIN_MS = 5
 
+# Upper bound on concurrent receivers for --parallel-probe
+PROBE_MAX_WORKERS = 8
 
-def get_rss_mb() -> float | None:
-    try:
-        psapi = ctypes.WinDLL("psapi", use_last_error=True)
-        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+# Time one in this many conversions; avg_ms is extrapolated from the sample
+CONVERSION_TIMING_SAMPLE_EVERY = 30
 
-        get_current_process = kernel32.GetCurrentProcess
-        get_current_process.restype = wintypes.HANDLE
 
-        get_process_memory_info = psapi.GetProcessMemoryInfo
-        get_process_memory_info.argtypes = [
-            wintypes.HANDLE,
-            ctypes.POINTER(PROCESS_MEMORY_COUNTERS_EX),
-            wintypes.DWORD,
-        ]
-        get_process_memory_info.restype = wintypes.BOOL
+# PROCESS_MEMORY_COUNTERS_EX is two DWORDs (cb, PageFaultCount) followed by nine
+# SIZE_T fields; only WorkingSetSize (the second SIZE_T) is read, through a
+# fixed-offset view into one reused raw buffer.
+_COUNTERS_SIZE = 2 * ctypes.sizeof(ctypes.c_uint32) + 9 * ctypes.sizeof(ctypes.c_size_t)
+_WORKING_SET_OFFSET = 2 * ctypes.sizeof(ctypes.c_uint32) + ctypes.sizeof(ctypes.c_size_t)
+
+# Resolve GetProcessMemoryInfo once and reuse one counters buffer per sample.
+try:
+    _psapi = ctypes.WinDLL("psapi", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+
+    _get_process_memory_info = _psapi.GetProcessMemoryInfo
+    _get_process_memory_info.argtypes = [wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD]
+    _get_process_memory_info.restype = wintypes.BOOL
 
-        counters = PROCESS_MEMORY_COUNTERS_EX()
-        counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS_EX)
-        ok = get_process_memory_info(get_current_process(), ctypes.byref(counters), counters.cb)
-        if not ok:
+    _process_handle = _kernel32.GetCurrentProcess()
+    _counters_buf = (ctypes.c_char * _COUNTERS_SIZE)()
+    ctypes.c_uint32.from_buffer(_counters_buf, 0).value = _COUNTERS_SIZE
+    _counters_ref = ctypes.byref(_counters_buf)
+    _working_set = ctypes.c_size_t.from_buffer(_counters_buf, _WORKING_SET_OFFSET)
+except (AttributeError, OSError):
+    _get_process_memory_info = None
+
+
+def get_rss_mb() -> float | None:
+    if _get_process_memory_info is None:
+        return None
+    try:
+        if not _get_process_memory_info(_process_handle, _counters_ref, _COUNTERS_SIZE):
             return None
-        return counters.WorkingSetSize / (1024 * 1024)
+        return _working_set.value / (1024 * 1024)
     except Exception:
         return None
 
@@ -87,72 +97,174 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--select-mode", choices=["first", "responsive"], default="responsive")
     parser.add_argument("--probe-timeout-sec", type=int, default=3)
     parser.add_argument("--probe-min-frames", type=int, default=5)
+    parser.add_argument(
+        "--parallel-probe",
+        action="store_true",
+        help="Probe discovered sources concurrently instead of one after another",
+    )
     parser.add_argument("--ndi-interface-ip", type=str, default="")
+    parser.add_argument(
+        "--fixed-timeout",
+        action="store_true",
+        help="Always poll with --capture-timeout-ms instead of adapting to the frame interval",
+    )
     parser.add_argument(
         "--convert", action="store_true", help="Enable UYVY->RGB conversion on each video frame"
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--convert-backend",
+        choices=["numpy", "numba", "opencv", "ndi"],
+        default=default_convert_backend(),
+        help=(
+            "UYVY->RGB implementation used with --convert (numpy is the baseline for A/B "
+            "timing; ndi requests RGBA from the NDI runtime so no CPU pass runs in Python)"
+        ),
+    )
+    args = parser.parse_args()
+    if args.convert_backend == "opencv" and cv2 is None:
+        parser.error("--convert-backend opencv requires OpenCV (pip install opencv-python)")
+    if args.convert_backend == "numba" and not numba_available:
+        parser.error("--convert-backend numba requires Numba (pip install numba)")
+    return args
 
 
-def frame_to_bytes(video_frame) -> bytes:
-    if hasattr(video_frame.data, "tobytes"):
-        return video_frame.data.tobytes()
-    if hasattr(video_frame.data, "__array__"):
-        import numpy as np
+def default_convert_backend() -> str:
+    if cv2 is not None:
+        return "opencv"
+    if numba_available:
+        return "numba"
+    return "numpy"
+
+
+def frame_as_uint8(video_frame, line_stride: int, height: int):
+    """Return a flat uint8 view over the frame payload without copying.
 
-        return bytes(np.array(video_frame.data).flatten())
-    return bytes(video_frame.data)
+    The view aliases NDI-owned memory and is only valid until
+    recv_free_video_v2() is called for the frame.
+    """
+    import numpy as np
+
+    data = video_frame.data
+    if hasattr(data, "__array_interface__"):
+        arr = np.asarray(data)
+        if arr.flags.c_contiguous:
+            return arr.reshape(-1)
+        address = arr.__array_interface__["data"][0]
+    else:
+        address = ctypes.cast(data, ctypes.c_void_p).value
+    buffer = (ctypes.c_uint8 * (line_stride * height)).from_address(address)
+    return np.frombuffer(buffer, dtype=np.uint8)
 
 
-def uyvy_to_rgb(uyvy_data: bytes, width: int, height: int, line_stride: int) -> bytes:
-    """Convert UYVY422 to RGB888 (same approach as app, no UI rendering)."""
+def new_rgb_buffer(width: int, height: int):
+    """Allocate the reusable RGB888 destination for one frame size."""
     import numpy as np
 
-    frame = np.frombuffer(uyvy_data, dtype=np.uint8)
+    return np.empty((height, width, 3), dtype=np.uint8)
+
+
+def uyvy_to_rgb_numba(frame, out, width: int, height: int, line_stride: int) -> None:
+    """Convert UYVY422 into ``out`` with the fused Numba kernel."""
+    uyvy_to_rgb_into(frame, out, width, height, line_stride)
+
 
+def uyvy_to_rgb_cv(frame, out, width: int, height: int, line_stride: int) -> None:
+    """Convert UYVY422 into ``out`` with OpenCV's SIMD color conversion.
+
+    OpenCV assumes studio-range (16-235) luma, so pixel values differ slightly
+    from the full-range NumPy path; byte counts and timing are comparable.
+    """
     if line_stride != width * 2:
-        frame = frame.reshape(height, line_stride)[:, : width * 2].flatten()
+        frame = frame.reshape(height, line_stride)[:, : width * 2]
+    frame = frame.reshape(height, width, 2)
+    cv2.cvtColor(frame, cv2.COLOR_YUV2RGB_UYVY, dst=out)
+
+
+# Float32 scratch planes for the NumPy path, keyed by (height, width)
+_numpy_scratch: dict[tuple[int, int], tuple] = {}
+
+
+def get_numpy_scratch(width: int, height: int) -> tuple:
+    """Return (u, v, dr, dg, db, tmp) float32 planes of shape (height, width // 2)."""
+    key = (height, width)
+    scratch = _numpy_scratch.get(key)
+    if scratch is None:
+        import numpy as np
+
+        scratch = tuple(np.empty((height, width // 2), dtype=np.float32) for _ in range(6))
+        _numpy_scratch[key] = scratch
+    return scratch
+
+
+def unpack_uyvy(frame, width: int, height: int, line_stride: int):
+    """View a flat UYVY payload as (height, width // 2, 4) pixel pairs, dropping row padding."""
+    if line_stride != width * 2:
+        frame = frame.reshape(height, line_stride)[:, : width * 2]
+    return frame.reshape(height, width // 2, 4)
+
+
+def chroma_to_rgb_deltas(uyvy, u, v, dr, dg, db, tmp) -> None:
+    """Fill dr/dg/db with the per-pair BT.601 chroma offsets."""
+    import numpy as np
+
+    f32 = np.float32
+    np.subtract(uyvy[:, :, 0], f32(128), out=u, dtype=f32)
+    np.subtract(uyvy[:, :, 2], f32(128), out=v, dtype=f32)
 
-    uyvy = frame.reshape(height, width // 2, 4)
+    np.multiply(v, f32(1.402), out=dr)
+    np.multiply(u, f32(-0.344), out=dg)
+    np.multiply(v, f32(0.714), out=tmp)
+    np.subtract(dg, tmp, out=dg)
+    np.multiply(u, f32(1.772), out=db)
 
-    u = uyvy[:, :, 0].astype(np.int16) - 128
-    y0 = uyvy[:, :, 1].astype(np.int16)
-    v = uyvy[:, :, 2].astype(np.int16) - 128
-    y1 = uyvy[:, :, 3].astype(np.int16)
 
-    del uyvy
-    del frame
+def pack_rgb(out, uyvy, dr, dg, db, tmp) -> None:
+    """Add luma to the chroma offsets, clip, and store into ``out``."""
+    import numpy as np
+
+    height, half_width = uyvy.shape[:2]
+    # View out as (h, w/2, pixel-in-pair, channel) so each store addresses one
+    # UYVY pair slot directly instead of slicing columns of the packed image.
+    pairs = out.reshape(height, half_width, 2, 3)
+    for pixel, luma_index in enumerate((1, 3)):
+        y = uyvy[:, :, luma_index]
+        for channel, delta in enumerate((dr, dg, db)):
+            np.add(y, delta, out=tmp, dtype=np.float32)
+            np.clip(tmp, 0, 255, out=tmp)
+            pairs[:, :, pixel, channel] = tmp
 
-    r0 = y0 + 1.402 * v
-    g0 = y0 - 0.344 * u - 0.714 * v
-    b0 = y0 + 1.772 * u
 
-    r1 = y1 + 1.402 * v
-    g1 = y1 - 0.344 * u - 0.714 * v
-    b1 = y1 + 1.772 * u
+def uyvy_to_rgb(frame, out, width: int, height: int, line_stride: int) -> None:
+    """Convert UYVY422 into ``out`` (same approach as app, no UI rendering).
 
-    del u, v, y0, y1
+    All arithmetic stays in preallocated float32 planes so nothing is promoted
+    to float64 and no per-frame temporaries are allocated.
+    """
+    uyvy = unpack_uyvy(frame, width, height, line_stride)
+    u, v, dr, dg, db, tmp = get_numpy_scratch(width, height)
+    chroma_to_rgb_deltas(uyvy, u, v, dr, dg, db, tmp)
+    pack_rgb(out, uyvy, dr, dg, db, tmp)
 
-    r0 = np.clip(r0, 0, 255).astype(np.uint8)
-    g0 = np.clip(g0, 0, 255).astype(np.uint8)
-    b0 = np.clip(b0, 0, 255).astype(np.uint8)
-    r1 = np.clip(r1, 0, 255).astype(np.uint8)
-    g1 = np.clip(g1, 0, 255).astype(np.uint8)
-    b1 = np.clip(b1, 0, 255).astype(np.uint8)
 
-    rgb = np.zeros((height, width, 3), dtype=np.uint8)
-    rgb[:, 0::2, 0] = r0
-    rgb[:, 0::2, 1] = g0
-    rgb[:, 0::2, 2] = b0
-    rgb[:, 1::2, 0] = r1
-    rgb[:, 1::2, 1] = g1
-    rgb[:, 1::2, 2] = b1
+CONVERTERS = {
+    "numpy": uyvy_to_rgb,
+    "numba": uyvy_to_rgb_numba,
+    "opencv": uyvy_to_rgb_cv,
+}
 
-    del r0, g0, b0, r1, g1, b1
 
-    out = rgb.tobytes()
-    del rgb
-    return out
+def warm_up_converter(convert) -> None:
+    """Run one tiny conversion so first-call setup (thread pools, caches) precedes timing."""
+    import numpy as np
+
+    width, height = 16, 2
+    convert(
+        np.zeros(width * 2 * height, dtype=np.uint8),
+        new_rgb_buffer(width, height),
+        width,
+        height,
+        width * 2,
+    )
 
 
 def configure_ndi_interface(args: argparse.Namespace) -> tuple[str | None, list[str]]:
@@ -204,13 +316,29 @@ def configure_ndi_interface(args: argparse.Namespace) -> tuple[str | None, list[
     return selected_ip, camera_ips
 
 
-def create_receiver(ndi: object, bandwidth: str):
+def resolve_receiver_constants(ndi: object, args: argparse.Namespace) -> None:
+    """Resolve --bandwidth and the receiver color format to NDI enum values once."""
     try:
-        recv_settings = ndi.RecvCreateV3()
-        recv_settings.color_format = ndi.RECV_COLOR_FORMAT_FASTEST
-        recv_settings.bandwidth = (
-            ndi.RECV_BANDWIDTH_HIGHEST if bandwidth == "high" else ndi.RECV_BANDWIDTH_LOWEST
+        args.color_format_const = (
+            ndi.RECV_COLOR_FORMAT_RGBX_RGBA
+            if args.convert and args.convert_backend == "ndi"
+            else ndi.RECV_COLOR_FORMAT_FASTEST
+        )
+        args.bandwidth_const = (
+            ndi.RECV_BANDWIDTH_HIGHEST if args.bandwidth == "high" else ndi.RECV_BANDWIDTH_LOWEST
         )
+    except AttributeError:
+        args.color_format_const = None
+        args.bandwidth_const = None
+
+
+def create_receiver(ndi: object, color_format: int | None, bandwidth: int | None):
+    if color_format is None or bandwidth is None:
+        return ndi.recv_create_v3()
+    try:
+        recv_settings = ndi.RecvCreateV3()
+        recv_settings.color_format = color_format
+        recv_settings.bandwidth = bandwidth
         recv_settings.allow_video_fields = True
         return ndi.recv_create_v3(recv_settings)
     except Exception:
@@ -235,18 +363,26 @@ def probe_source(
     none_frames = 0
     other_frames = 0
 
+    # Compare against prefetched ints; a `match` on dotted value patterns would
+    # redo the module attribute lookup for every case on every frame.
+    recv_capture = ndi.recv_capture_v3
+    FT_VIDEO = ndi.FRAME_TYPE_VIDEO
+    FT_AUDIO = ndi.FRAME_TYPE_AUDIO
+    FT_METADATA = ndi.FRAME_TYPE_METADATA
+    FT_NONE = ndi.FRAME_TYPE_NONE
+
     while time.time() < deadline:
-        t, v, a, m = ndi.recv_capture_v3(receiver, capture_timeout_ms)
-        if t == ndi.FRAME_TYPE_VIDEO:
+        t, v, a, m = recv_capture(receiver, capture_timeout_ms)
+        if t == FT_VIDEO:
             video_frames += 1
             ndi.recv_free_video_v2(receiver, v)
-        elif t == ndi.FRAME_TYPE_AUDIO:
+        elif t == FT_AUDIO:
             other_frames += 1
             ndi.recv_free_audio_v3(receiver, a)
-        elif t == ndi.FRAME_TYPE_METADATA:
+        elif t == FT_METADATA:
             other_frames += 1
             ndi.recv_free_metadata(receiver, m)
-        elif t == ndi.FRAME_TYPE_NONE:
+        elif t == FT_NONE:
             none_frames += 1
         else:
             other_frames += 1
@@ -254,6 +390,38 @@ def probe_source(
     return video_frames, none_frames, other_frames
 
 
+def probe_named_source(ndi: object, name: str, args: argparse.Namespace) -> int | None:
+    """Connect a fresh receiver to ``name`` and return its probe video frame count."""
+    receiver = None
+    try:
+        print(f"Probe start: {name}")
+        receiver = create_receiver(ndi, args.color_format_const, args.bandwidth_const)
+        if not receiver:
+            print(f"Probe skip (receiver create failed): {name}")
+            return None
+
+        # Use fresh source object by name for test harness stability.
+        # (Avoids potential native-lifetime edge cases with cached source objects.)
+        source = source_object(ndi, name)
+        ndi.recv_connect(receiver, source)
+        video_frames, none_frames, other_frames = probe_source(
+            ndi,
+            receiver,
+            args.probe_timeout_sec,
+            args.capture_timeout_ms,
+        )
+        print(f"Probe {name}: video={video_frames} none={none_frames} other={other_frames}")
+        return video_frames
+
+    except Exception as exc:
+        print(f"Probe failed for {name}: {exc}")
+        return None
+    finally:
+        if receiver:
+            with contextlib.suppress(Exception):
+                ndi.recv_destroy(receiver)
+
+
 def choose_source(ndi: object, cameras: list[str], args: argparse.Namespace) -> str | None:
     if args.source_name:
         if args.source_name in cameras:
@@ -268,40 +436,21 @@ def choose_source(ndi: object, cameras: list[str], args: argparse.Namespace) ->
         f"Probing {len(cameras)} discovered source(s) for responsiveness "
         f"(timeout={args.probe_timeout_sec}s, min_frames={args.probe_min_frames})..."
     )
+    if args.parallel_probe and len(cameras) > 1:
+        # One receiver per worker; NDI capture calls block in native code, so the
+        # probes overlap and the whole pass takes about one probe_timeout_sec.
+        with ThreadPoolExecutor(max_workers=min(PROBE_MAX_WORKERS, len(cameras))) as executor:
+            results = list(executor.map(lambda name: probe_named_source(ndi, name, args), cameras))
+    else:
+        results = [probe_named_source(ndi, name, args) for name in cameras]
+
+    # Scan in discovery order so ties keep favouring the earlier source.
     best_name: str | None = None
     best_video_frames = -1
-
-    for name in cameras:
-        receiver = None
-        try:
-            print(f"Probe start: {name}")
-            receiver = create_receiver(ndi, args.bandwidth)
-            if not receiver:
-                print(f"Probe skip (receiver create failed): {name}")
-                continue
-
-            # Use fresh source object by name for test harness stability.
-            # (Avoids potential native-lifetime edge cases with cached source objects.)
-            source = source_object(ndi, name)
-            ndi.recv_connect(receiver, source)
-            video_frames, none_frames, other_frames = probe_source(
-                ndi,
-                receiver,
-                args.probe_timeout_sec,
-                args.capture_timeout_ms,
-            )
-            print(f"Probe {name}: video={video_frames} none={none_frames} other={other_frames}")
-
-            if video_frames > best_video_frames:
-                best_video_frames = video_frames
-                best_name = name
-
-        except Exception as exc:
-            print(f"Probe failed for {name}: {exc}")
-        finally:
-            if receiver:
-                with contextlib.suppress(Exception):
-                    ndi.recv_destroy(receiver)
+    for name, video_frames in zip(cameras, results, strict=True):
+        if video_frames is not None and video_frames > best_video_frames:
+            best_video_frames = video_frames
+            best_name = name
 
     if best_name is None:
         return None
@@ -322,6 +471,10 @@ def main() -> int:
     if not ndi_video.ndi_available:
         print("NDI not available. Install NDI Runtime and verify wrapper import.")
         return 1
+    resolve_receiver_constants(ndi_video.ndi, args)
+    # Reports are flushed explicitly once per interval.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
 
     stop_requested = False
     selected_interface_ip, camera_ips_from_config = configure_ndi_interface(args)
@@ -385,13 +538,15 @@ def main() -> int:
     other_frames = 0
     converted_frames = 0
     conversion_failures = 0
-    converted_rgb_mb = 0.0
+    converted_rgb_bytes = 0
     conversion_time_s = 0.0
+    timed_conversions = 0
+    timing_index = 0
 
     try:
         # Use fresh source object by name for test harness stability.
         source = source_object(ndi, source_name)
-        receiver = create_receiver(ndi, args.bandwidth)
+        receiver = create_receiver(ndi, args.color_format_const, args.bandwidth_const)
 
         if not receiver:
             print("Failed to create NDI receiver")
@@ -414,7 +569,17 @@ def main() -> int:
             f"Test context: interface_ip={selected_interface_ip} "
             f"camera_ips_from_config={camera_ips_from_config}"
         )
-        print(f"Conversion mode: {'UYVY->RGB enabled' if args.convert else 'disabled'}")
+        print(
+            f"Conversion mode: UYVY->RGB enabled (backend={args.convert_backend})"
+            if args.convert
+            else "Conversion mode: disabled"
+        )
+        # None for the "ndi" backend: the runtime delivers RGBA/RGBX frames itself.
+        convert = CONVERTERS.get(args.convert_backend)
+        rgb_buf = None
+        rgb_shape: tuple[int, int] | None = None
+        if args.convert and convert is not None:
+            warm_up_converter(convert)
 
         start = time.time()
         last_report = start
@@ -426,6 +591,28 @@ def main() -> int:
             if baseline_rss is not None
             else "Baseline RSS: n/a"
         )
+        sys.stdout.flush()
+
+        # Adaptive capture timeout: ~1.5x the EMA frame interval while video is
+        # flowing, back to the configured timeout on idle so
+        # --max-no-frame-attempts keeps its meaning.
+        capture_timeout_ms = args.capture_timeout_ms
+        frame_interval_ms: float | None = None
+        last_video_ts: float | None = None
+
+        # Resolve NDI entry points and constants once; the loop runs per frame.
+        recv_capture = ndi.recv_capture_v3
+        free_video = ndi.recv_free_video_v2
+        free_audio = ndi.recv_free_audio_v3
+        free_metadata = ndi.recv_free_metadata
+        FT_VIDEO = ndi.FRAME_TYPE_VIDEO
+        FT_AUDIO = ndi.FRAME_TYPE_AUDIO
+        FT_METADATA = ndi.FRAME_TYPE_METADATA
+        FT_NONE = ndi.FRAME_TYPE_NONE
+        FT_ERROR = getattr(ndi, "FRAME_TYPE_ERROR", None)
+        FOURCC_UYVY = ndi.FOURCC_VIDEO_TYPE_UYVY
+        FOURCC_SDK_RGB = (ndi.FOURCC_VIDEO_TYPE_RGBA, ndi.FOURCC_VIDEO_TYPE_RGBX)
+        get_counters = getattr(ndi, "debug_get_counters", None)
 
         while not stop_requested:
             now = time.time()
@@ -433,43 +620,76 @@ def main() -> int:
             if elapsed >= args.duration_sec:
                 break
 
-            t, v, a, m = ndi.recv_capture_v3(receiver, args.capture_timeout_ms)
-            if t == ndi.FRAME_TYPE_VIDEO:
+            t, v, a, m = recv_capture(receiver, capture_timeout_ms)
+            if t == FT_VIDEO:
                 frames += 1
                 no_frame_attempts = 0
+                if not args.fixed_timeout:
+                    if last_video_ts is not None:
+                        interval_ms = (now - last_video_ts) * 1000
+                        frame_interval_ms = (
+                            interval_ms
+                            if frame_interval_ms is None
+                            else 0.9 * frame_interval_ms + 0.1 * interval_ms
+                        )
+                        capture_timeout_ms = max(
+                            ADAPTIVE_TIMEOUT_MIN_MS,
+                            min(args.capture_timeout_ms, int(1.5 * frame_interval_ms)),
+                        )
+                    last_video_ts = now
                 try:
                     if args.convert:
-                        started = time.perf_counter()
-                        if v.FourCC != ndi.FOURCC_VIDEO_TYPE_UYVY:
+                        timed = timing_index == 0
+                        timing_index = (timing_index + 1) % CONVERSION_TIMING_SAMPLE_EVERY
+                        if timed:
+                            started = time.perf_counter()
+                        if convert is None:
+                            # Converted by the NDI runtime; only account for the RGB bytes.
+                            if v.FourCC in FOURCC_SDK_RGB:
+                                converted_frames += 1
+                                converted_rgb_bytes += int(v.line_stride_in_bytes) * int(v.yres)
+                            else:
+                                conversion_failures += 1
+                        elif v.FourCC != FOURCC_UYVY:
                             conversion_failures += 1
                         else:
-                            frame_data = frame_to_bytes(v)
-                            rgb_data = uyvy_to_rgb(
-                                frame_data,
-                                int(v.xres),
-                                int(v.yres),
-                                int(v.line_stride_in_bytes),
+                            width = int(v.xres)
+                            height = int(v.yres)
+                            if rgb_shape != (height, width):
+                                rgb_buf = new_rgb_buffer(width, height)
+                                rgb_shape = (height, width)
+                            line_stride = int(v.line_stride_in_bytes)
+                            # Zero-copy view; consumed before recv_free_video_v2 below.
+                            convert(
+                                frame_as_uint8(v, line_stride, height),
+                                rgb_buf,
+                                width,
+                                height,
+                                line_stride,
                             )
                             converted_frames += 1
-                            converted_rgb_mb += len(rgb_data) / (1024 * 1024)
-                            del rgb_data
-                            del frame_data
-                        conversion_time_s += time.perf_counter() - started
+                            converted_rgb_bytes += rgb_buf.nbytes
+                        if timed:
+                            conversion_time_s += time.perf_counter() - started
+                            timed_conversions += 1
                 except Exception:
                     conversion_failures += 1
                 finally:
-                    ndi.recv_free_video_v2(receiver, v)
-            elif t == ndi.FRAME_TYPE_AUDIO:
-                ndi.recv_free_audio_v3(receiver, a)
-            elif t == ndi.FRAME_TYPE_METADATA:
-                ndi.recv_free_metadata(receiver, m)
-            elif t == ndi.FRAME_TYPE_NONE:
+                    free_video(receiver, v)
+            elif t == FT_AUDIO:
+                free_audio(receiver, a)
+            elif t == FT_METADATA:
+                free_metadata(receiver, m)
+            elif t == FT_NONE:
                 none_frames += 1
                 no_frame_attempts += 1
+                capture_timeout_ms = args.capture_timeout_ms
+                frame_interval_ms = None
+                last_video_ts = None
                 if no_frame_attempts >= args.max_no_frame_attempts:
                     print(f"No video frames for {no_frame_attempts} attempts; stopping test.")
                     break
-            elif hasattr(ndi, "FRAME_TYPE_ERROR") and t == ndi.FRAME_TYPE_ERROR:
+            elif FT_ERROR is not None and t == FT_ERROR:
                 error_frames += 1
             else:
                 other_frames += 1
@@ -477,42 +697,48 @@ def main() -> int:
             if now - last_report >= args.report_every_sec:
                 rss = get_rss_mb()
                 fps = frames / elapsed if elapsed > 0 else 0.0
+                # Collect the report and emit it with one write so console I/O
+                # does not stall the capture loop several times per report.
+                report: list[str] = []
 
                 if rss is not None and baseline_rss is not None and last_rss is not None:
-                    print(
+                    report.append(
                         f"t={elapsed:6.1f}s frames={frames:7d} fps={fps:6.1f} "
                         f"rss={rss:7.1f}MB delta={rss - baseline_rss:+7.1f}MB "
                         f"step={rss - last_rss:+6.1f}MB"
                     )
                     last_rss = rss
                 else:
-                    print(f"t={elapsed:6.1f}s frames={frames:7d} fps={fps:6.1f}")
+                    report.append(f"t={elapsed:6.1f}s frames={frames:7d} fps={fps:6.1f}")
 
-                if hasattr(ndi, "debug_get_counters"):
-                    counters = ndi.debug_get_counters()
+                if get_counters is not None:
+                    counters = get_counters()
                     recv_out = int(counters.get("recv_instances_outstanding", 0))
                     find_out = int(counters.get("find_instances_outstanding", 0))
                     cap_vid = int(counters.get("recv_capture_video_frames_total", 0))
                     free_v = int(counters.get("recv_free_video_total", 0))
-                    print(
+                    report.append(
                         f"  wrapper: recv_out={recv_out} find_out={find_out} "
                         f"cap_vid={cap_vid} free_v={free_v} vid_imb={cap_vid - free_v:+d}"
                     )
-                print(
+                report.append(
                     f"  frame_types: video={frames} none={none_frames} "
                     f"error={error_frames} other={other_frames}"
                 )
                 if args.convert:
                     avg_conv_ms = (
-                        (conversion_time_s / converted_frames) * 1000
-                        if converted_frames > 0
+                        (conversion_time_s / timed_conversions) * 1000
+                        if timed_conversions > 0
                         else 0.0
                     )
-                    print(
+                    converted_rgb_mb = converted_rgb_bytes / (1024 * 1024)
+                    report.append(
                         f"  conversion: frames={converted_frames} failures={conversion_failures} "
                         f"rgb_total={converted_rgb_mb:.1f}MB avg_ms={avg_conv_ms:.3f}"
                     )
 
+                sys.stdout.write("\n".join(report) + "\n")
+                sys.stdout.flush()
                 last_report = now
 
         total = time.time() - start
@@ -533,8 +759,9 @@ def main() -> int:
         )
         if args.convert:
             avg_conv_ms = (
-                (conversion_time_s / converted_frames) * 1000 if converted_frames > 0 else 0.0
+                (conversion_time_s / timed_conversions) * 1000 if timed_conversions > 0 else 0.0
             )
+            converted_rgb_mb = converted_rgb_bytes / (1024 * 1024)
             print(
                 f"Final conversion: frames={converted_frames} failures={conversion_failures} "
                 f"rgb_total={converted_rgb_mb:.1f}MB avg_ms={avg_conv_ms:.3f}"
@@ -18,12 +18,16 @@ import contextlib
 import ctypes
 import signal
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import wintypes
 from pathlib import Path
 
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPixmap
+import numpy as np
+from PyQt6.QtCore import QEvent, QMetaObject, QRect, Qt, QTimer, pyqtSlot
+from PyQt6.QtGui import QPainter, QPixmap
+from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 from PyQt6.QtWidgets import QApplication, QLabel, QMainWindow, QVBoxLayout, QWidget
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -33,45 +37,61 @@ if str(REPO_ROOT) not in sys.path:
 from videocue.controllers import ndi_video  # noqa: E402
 from videocue.models.config_manager import ConfigManager  # noqa: E402
 
+# Upper bound on concurrent receivers for --parallel-probe
+PROBE_MAX_WORKERS = 8
 
-class PROCESS_MEMORY_COUNTERS_EX(ctypes.Structure):  # noqa: N801
-    _fields_ = [
-        ("cb", wintypes.DWORD),
-        ("PageFaultCount", wintypes.DWORD),
-        ("PeakWorkingSetSize", ctypes.c_size_t),
-        ("WorkingSetSize", ctypes.c_size_t),
-        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
-        ("QuotaPagedPoolUsage", ctypes.c_size_t),
-        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
-        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
-        ("PagefileUsage", ctypes.c_size_t),
-        ("PeakPagefileUsage", ctypes.c_size_t),
-        ("PrivateUsage", ctypes.c_size_t),
-    ]
+
+# PROCESS_MEMORY_COUNTERS_EX is two DWORDs (cb, PageFaultCount) followed by nine
+# SIZE_T fields; only WorkingSetSize (the second SIZE_T) is read, through a
+# fixed-offset view into one reused raw buffer so sampling creates no ctypes objects.
+_COUNTERS_SIZE = 2 * ctypes.sizeof(ctypes.c_uint32) + 9 * ctypes.sizeof(ctypes.c_size_t)
+_WORKING_SET_OFFSET = 2 * ctypes.sizeof(ctypes.c_uint32) + ctypes.sizeof(ctypes.c_size_t)
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# psutil (optional) works on every platform and keeps its process handle open;
+# reports the same working-set figure as GetProcessMemoryInfo on Windows.
+try:
+    import psutil
+
+    _memory_info = psutil.Process().memory_info
+except ImportError:
+    psutil = None
+    _memory_info = None
+
+# Without psutil, resolve GetProcessMemoryInfo once and reuse one counters buffer.
+_get_process_memory_info = None
+if _memory_info is None and sys.platform == "win32":
+    try:
+        _psapi = ctypes.WinDLL("psapi", use_last_error=True)
+        _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        _kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+
+        _get_process_memory_info = _psapi.GetProcessMemoryInfo
+        _get_process_memory_info.argtypes = [wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD]
+        _get_process_memory_info.restype = wintypes.BOOL
+
+        # GetCurrentProcess returns a constant pseudo-handle; safe to keep.
+        _process_handle = _kernel32.GetCurrentProcess()
+        _counters_buf = (ctypes.c_char * _COUNTERS_SIZE)()
+        ctypes.c_uint32.from_buffer(_counters_buf, 0).value = _COUNTERS_SIZE
+        _counters_ref = ctypes.byref(_counters_buf)
+        _working_set = ctypes.c_size_t.from_buffer(_counters_buf, _WORKING_SET_OFFSET)
+    except (AttributeError, OSError):
+        _get_process_memory_info = None
 
 
 def get_rss_mb() -> float | None:
+    if _memory_info is not None:
+        try:
+            return _memory_info().rss * _BYTES_TO_MB
+        except psutil.Error:
+            return None
+    if _get_process_memory_info is None:
+        return None
     try:
-        psapi = ctypes.WinDLL("psapi", use_last_error=True)
-        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
-
-        get_current_process = kernel32.GetCurrentProcess
-        get_current_process.restype = wintypes.HANDLE
-
-        get_process_memory_info = psapi.GetProcessMemoryInfo
-        get_process_memory_info.argtypes = [
-            wintypes.HANDLE,
-            ctypes.POINTER(PROCESS_MEMORY_COUNTERS_EX),
-            wintypes.DWORD,
-        ]
-        get_process_memory_info.restype = wintypes.BOOL
-
-        counters = PROCESS_MEMORY_COUNTERS_EX()
-        counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS_EX)
-        ok = get_process_memory_info(get_current_process(), ctypes.byref(counters), counters.cb)
-        if not ok:
+        if not _get_process_memory_info(_process_handle, _counters_ref, _COUNTERS_SIZE):
             return None
-        return counters.WorkingSetSize / (1024 * 1024)
+        return _working_set.value * _BYTES_TO_MB
     except Exception:
         return None
 
@@ -95,6 +115,23 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--color-format", choices=["bgra", "rgba", "uyvy"], default="bgra")
     parser.add_argument("--frame-skip", type=int, default=2)
     parser.add_argument("--warmup-sec", type=int, default=30)
+    parser.add_argument(
+        "--parallel-probe",
+        action="store_true",
+        help="Probe and verify sources concurrently instead of one after another",
+    )
+    parser.add_argument(
+        "--display",
+        choices=["opengl", "label"],
+        default="opengl",
+        help="Video surface: QOpenGLWidget (GPU upload/scaling) or QLabel pixmaps like the app",
+    )
+    parser.add_argument(
+        "--frame-pool",
+        type=int,
+        default=4,
+        help="Reusable BGRA/RGBA frame buffers in the conversion worker (0 = allocate per frame)",
+    )
     return parser.parse_args()
 
 
@@ -131,23 +168,42 @@ def probe_source(
             return (0, 0, 0)
 
         ndi.recv_connect(receiver, source_object(ndi, source_name))
-        deadline = time.time() + max(1, timeout_sec)
+
+        # Native drain (wrapper builds that export recv_drain) runs the whole
+        # capture/free loop in C++ without the GIL.
+        recv_drain = getattr(ndi, "recv_drain", None)
+        if recv_drain is not None:
+            return recv_drain(receiver, capture_timeout_ms, max(1, timeout_sec) * 1000)
+
         video_frames = 0
         none_frames = 0
         other_frames = 0
 
-        while time.time() < deadline:
-            t, v, a, m = ndi.recv_capture_v3(receiver, capture_timeout_ms)
-            if t == ndi.FRAME_TYPE_VIDEO:
+        # Bind the capture/free calls and frame types once; the loop runs every
+        # capture_timeout_ms for the whole probe window.
+        recv_capture = ndi.recv_capture_v3
+        free_video = ndi.recv_free_video_v2
+        free_audio = ndi.recv_free_audio_v3
+        free_metadata = ndi.recv_free_metadata
+        FT_VIDEO = ndi.FRAME_TYPE_VIDEO
+        FT_AUDIO = ndi.FRAME_TYPE_AUDIO
+        FT_METADATA = ndi.FRAME_TYPE_METADATA
+        FT_NONE = ndi.FRAME_TYPE_NONE
+        monotonic_ns = time.monotonic_ns
+        deadline = monotonic_ns() + max(1, timeout_sec) * 1_000_000_000
+
+        while monotonic_ns() < deadline:
+            t, v, a, m = recv_capture(receiver, capture_timeout_ms)
+            if t == FT_VIDEO:
                 video_frames += 1
-                ndi.recv_free_video_v2(receiver, v)
-            elif t == ndi.FRAME_TYPE_AUDIO:
+                free_video(receiver, v)
+            elif t == FT_AUDIO:
                 other_frames += 1
-                ndi.recv_free_audio_v3(receiver, a)
-            elif t == ndi.FRAME_TYPE_METADATA:
+                free_audio(receiver, a)
+            elif t == FT_METADATA:
                 other_frames += 1
-                ndi.recv_free_metadata(receiver, m)
-            elif t == ndi.FRAME_TYPE_NONE:
+                free_metadata(receiver, m)
+            elif t == FT_NONE:
                 none_frames += 1
             else:
                 other_frames += 1
@@ -159,7 +215,30 @@ def probe_source(
                 ndi.recv_destroy(receiver)
 
 
-def choose_source_candidates(args: argparse.Namespace) -> list[tuple[str, int]]:
+def probe_sources(
+    ndi: object,
+    names: list[str],
+    args: argparse.Namespace,
+    timeout_sec: int,
+) -> list[tuple[int, int, int]]:
+    """Probe each source with its own receiver; results follow the order of ``names``."""
+
+    def _probe(name: str) -> tuple[int, int, int]:
+        return probe_source(ndi, name, args.bandwidth, timeout_sec, args.capture_timeout_ms)
+
+    if args.parallel_probe and len(names) > 1:
+        # One receiver per worker; NDI capture calls block in native code, so the
+        # probes overlap and the whole pass takes about one timeout_sec.
+        with ThreadPoolExecutor(max_workers=min(PROBE_MAX_WORKERS, len(names))) as executor:
+            return list(executor.map(_probe, names))
+    return [_probe(name) for name in names]
+
+
+def choose_source_candidates(
+    args: argparse.Namespace, stop_event: threading.Event | None = None
+) -> list[tuple[str, int]]:
+    if stop_event is None:
+        stop_event = threading.Event()
     print("Discovering NDI cameras...")
     expected_count = 0
     try:
@@ -199,13 +278,14 @@ def choose_source_candidates(args: argparse.Namespace) -> list[tuple[str, int]]:
     threshold_hit = False
 
     for round_idx in range(1, rounds + 1):
-        if round_idx > 1:
+        if round_idx > 1 and not (expected_count and len(best_scores) >= expected_count):
+            # One discovery pass per round; its cache already lists every source seen,
+            # so a second find_ndi_cameras wait would only repeat the same scan.
             ndi_video.discover_and_cache_all_sources(
                 timeout_ms=max(args.discovery_timeout_ms, 10000),
                 expected_count=expected_count,
             )
-            refreshed_cameras = ndi_video.find_ndi_cameras(timeout_ms=args.discovery_timeout_ms)
-            for refreshed_name in refreshed_cameras:
+            for refreshed_name in ndi_video.get_cached_source_names():
                 if refreshed_name not in best_scores:
                     best_scores[refreshed_name] = 0
             cameras = list(best_scores.keys())
@@ -214,13 +294,8 @@ def choose_source_candidates(args: argparse.Namespace) -> list[tuple[str, int]]:
 
         for name in cameras:
             print(f"Probe start: {name}")
-            video_frames, none_frames, other_frames = probe_source(
-                ndi,
-                name,
-                args.bandwidth,
-                args.probe_timeout_sec,
-                args.capture_timeout_ms,
-            )
+        results = probe_sources(ndi, cameras, args, args.probe_timeout_sec)
+        for name, (video_frames, none_frames, other_frames) in zip(cameras, results, strict=True):
             print(f"Probe {name}: video={video_frames} none={none_frames} other={other_frames}")
             if video_frames > best_scores[name]:
                 best_scores[name] = video_frames
@@ -230,8 +305,9 @@ def choose_source_candidates(args: argparse.Namespace) -> list[tuple[str, int]]:
         if threshold_hit:
             break
 
-        if round_idx < rounds:
-            time.sleep(max(0.0, args.probe_retry_delay_ms / 1000.0))
+        # Wait on the stop event rather than sleeping so Ctrl+C ends probing at once
+        if round_idx < rounds and stop_event.wait(max(0.0, args.probe_retry_delay_ms / 1000.0)):
+            break
 
     scored: list[tuple[str, int]] = list(best_scores.items())
 
@@ -255,31 +331,56 @@ def pick_verified_source(args: argparse.Namespace, candidates: list[tuple[str, i
     ndi = ndi_video.ndi
     best_name: str | None = None
     best_observed = -1
+    rounds = max(1, args.verify_rounds)
 
-    for name, probe_score in candidates:
-        rounds = max(1, args.verify_rounds)
+    if args.parallel_probe and len(candidates) > 1:
+        # Verify every candidate at once per round; ranking still decides ties.
+        names = [name for name, _ in candidates]
         for round_idx in range(1, rounds + 1):
             print(
-                f"Preflight verify: {name} round={round_idx}/{rounds} "
-                f"(probe_score={probe_score}, timeout={args.verify_timeout_sec}s, "
-                f"min_frames={args.verify_min_frames})"
-            )
-            video_frames, none_frames, other_frames = probe_source(
-                ndi,
-                name,
-                args.bandwidth,
-                args.verify_timeout_sec,
-                args.capture_timeout_ms,
+                f"Preflight verify: {len(names)} source(s) round={round_idx}/{rounds} "
+                f"(timeout={args.verify_timeout_sec}s, min_frames={args.verify_min_frames})"
             )
-            print(f"Preflight {name}: video={video_frames} none={none_frames} other={other_frames}")
+            results = probe_sources(ndi, names, args, args.verify_timeout_sec)
+            for name, (video_frames, none_frames, other_frames) in zip(names, results, strict=True):
+                print(
+                    f"Preflight {name}: video={video_frames} none={none_frames} "
+                    f"other={other_frames}"
+                )
+                if video_frames > best_observed:
+                    best_observed = video_frames
+                    best_name = name
+            for name, (video_frames, _, _) in zip(names, results, strict=True):
+                if video_frames >= args.verify_min_frames:
+                    print(f"Selected verified source: {name}")
+                    return name
+    else:
+        for name, probe_score in candidates:
+            for round_idx in range(1, rounds + 1):
+                print(
+                    f"Preflight verify: {name} round={round_idx}/{rounds} "
+                    f"(probe_score={probe_score}, timeout={args.verify_timeout_sec}s, "
+                    f"min_frames={args.verify_min_frames})"
+                )
+                video_frames, none_frames, other_frames = probe_source(
+                    ndi,
+                    name,
+                    args.bandwidth,
+                    args.verify_timeout_sec,
+                    args.capture_timeout_ms,
+                )
+                print(
+                    f"Preflight {name}: video={video_frames} none={none_frames} "
+                    f"other={other_frames}"
+                )
 
-            if video_frames > best_observed:
-                best_observed = video_frames
-                best_name = name
+                if video_frames > best_observed:
+                    best_observed = video_frames
+                    best_name = name
 
-            if video_frames >= args.verify_min_frames:
-                print(f"Selected verified source: {name}")
-                return name
+                if video_frames >= args.verify_min_frames:
+                    print(f"Selected verified source: {name}")
+                    return name
 
     if best_name is not None:
         print(
@@ -311,6 +412,88 @@ def configure_interface(args: argparse.Namespace) -> None:
         print("NDI interface: default")
 
 
+class LatestFrameSlot:
+    """Size-1, latest-wins handoff from the conversion worker to the UI thread.
+
+    The producer never blocks on the consumer; a frame that is not rendered
+    before the next one arrives is released immediately instead of queueing.
+    """
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = None
+
+    def swap(self, value):
+        """Store ``value`` and return the previous occupant (or None)."""
+        with self._lock:
+            previous = self._value
+            self._value = value
+        return previous
+
+    def take(self):
+        """Remove and return the current frame (or None)."""
+        return self.swap(None)
+
+
+class RunningStats:
+    """Count/min/max/sum kept up to date per sample, so run stats need no scan."""
+
+    __slots__ = ("count", "minimum", "maximum", "total")
+
+    def __init__(self):
+        self.count = 0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.total = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    @property
+    def band(self) -> float:
+        return self.maximum - self.minimum if self.count else 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class GLVideoWidget(QOpenGLWidget):
+    """Video surface drawn with QPainter's OpenGL engine.
+
+    Each frame is uploaded once as a texture and scaled on the GPU, so there
+    is no per-frame QPixmap allocation or CPU-side scaling.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._image = None
+        self.setMinimumSize(640, 360)
+
+    def set_image(self, qimage):
+        """Show a new frame and return the one it replaces."""
+        previous, self._image = self._image, qimage
+        self.update()
+        return previous
+
+    def paintGL(self):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.GlobalColor.black)
+        if self._image is not None:
+            target = self._image.size().scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio)
+            x = (self.width() - target.width()) // 2
+            y = (self.height() - target.height()) // 2
+            painter.drawImage(QRect(x, y, target.width(), target.height()), self._image)
+        painter.end()
+
+
 class NDITestWindow(QMainWindow):
     def __init__(self, source_name: str, args: argparse.Namespace):
         super().__init__()
@@ -322,9 +505,16 @@ class NDITestWindow(QMainWindow):
         self.start_time = time.time()
         self.baseline_rss = get_rss_mb()
         self.last_rss = self.baseline_rss
-        self.rss_samples: list[tuple[float, float]] = []
+        # Pre-sized sample arrays (one per report tick, plus the baseline)
+        capacity = self.args.duration_sec // max(1, self.args.report_every_sec) + 2
+        self._rss_ts = np.empty(capacity, dtype=np.float64)
+        self._rss_mb = np.empty_like(self._rss_ts)
+        self._n = 0
+        # Whole-run and post-warmup extrema, updated as samples arrive
+        self.rss_stats = RunningStats()
+        self.steady_rss_stats = RunningStats()
         if self.baseline_rss is not None:
-            self.rss_samples.append((0.0, self.baseline_rss))
+            self._append_rss_sample(0.0, self.baseline_rss)
 
         self.setWindowTitle(f"NDI UI Test - {source_name}")
         self.resize(960, 600)
@@ -337,22 +527,34 @@ class NDITestWindow(QMainWindow):
         self.info_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
         layout.addWidget(self.info_label)
 
-        self.video_label = QLabel("Waiting for video...")
-        self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.video_label.setMinimumSize(640, 360)
-        self.video_label.setStyleSheet("background-color: black; color: white;")
-        layout.addWidget(self.video_label, stretch=1)
-        self._latest_frame = None
-        self._display_pixmap = QPixmap()
-
-        self.render_timer = QTimer(self)
-        self.render_timer.setInterval(33)
-        self.render_timer.timeout.connect(self._render_latest_frame)
-        self.render_timer.start()
-
+        self.video_gl = None
+        self.video_label = None
+        if self.args.display == "opengl":
+            self.video_gl = GLVideoWidget()
+            layout.addWidget(self.video_gl, stretch=1)
+        else:
+            self.video_label = QLabel("Waiting for video...")
+            self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.video_label.setMinimumSize(640, 360)
+            self.video_label.setStyleSheet("background-color: black; color: white;")
+            layout.addWidget(self.video_label, stretch=1)
+            # Scaling target, refreshed only when the label is resized.
+            self._target_size = self.video_label.size()
+            self._pixmaps = (QPixmap(), QPixmap())
+            self._pixmap_index = 0
+            self.video_label.installEventFilter(self)
+        self._latest_frame = LatestFrameSlot()
+
+        # Set while a queued render is outstanding so bursts collapse to one paint
+        self._render_pending = False
+
+        # Single-shot, re-armed after each report completes, so a slow sample
+        # (or a stalled event loop) never produces a burst of catch-up ticks.
+        self._report_interval_ms = max(1000, self.args.report_every_sec * 1000)
         self.report_timer = QTimer(self)
+        self.report_timer.setSingleShot(True)
         self.report_timer.timeout.connect(self._report)
-        self.report_timer.start(max(1000, self.args.report_every_sec * 1000))
+        self.report_timer.start(self._report_interval_ms)
 
         self.stop_timer = QTimer(self)
         self.stop_timer.setSingleShot(True)
@@ -367,8 +569,12 @@ class NDITestWindow(QMainWindow):
             frame_skip=self.args.frame_skip,
             bandwidth=self.args.bandwidth,
             color_format=self.args.color_format,
+            frame_pool_size=max(0, self.args.frame_pool),
         )
-        self.thread.frame_ready.connect(self._on_frame)
+        # Direct connection: _on_frame runs on the thread's NDIConvert-* worker, the only
+        # thread that emits frame_ready, so the slot and _render_pending still see a single
+        # producer. It only touches the slot, so Qt never queues more than the latest frame.
+        self.thread.frame_ready.connect(self._on_frame, Qt.ConnectionType.DirectConnection)
         self.thread.error.connect(self._on_error)
         self.thread.connected.connect(self._on_connected)
         self.thread.start()
@@ -383,25 +589,70 @@ class NDITestWindow(QMainWindow):
 
     def _on_frame(self, qimage):
         self.frame_count += 1
-        self._latest_frame = qimage
+        # Drop the unrendered predecessor now rather than on the next render.
+        dropped = self._latest_frame.swap(qimage)
+        self._release_frame(dropped)
+        if not self._render_pending:
+            self._render_pending = True
+            # The conversion worker has no event loop; queue the render on the GUI thread.
+            QMetaObject.invokeMethod(
+                self, "_render_latest_frame", Qt.ConnectionType.QueuedConnection
+            )
 
+    @pyqtSlot()
     def _render_latest_frame(self):
-        if self._latest_frame is None:
+        # Clear before taking so a frame landing mid-render schedules another pass.
+        self._render_pending = False
+        qimage = self._latest_frame.take()
+        if qimage is None:
             return
 
-        qimage = self._latest_frame
-        self._latest_frame = None
         self.render_count += 1
 
-        scaled = qimage.scaled(
-            self.video_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.FastTransformation,
-        )
-        self._display_pixmap.convertFromImage(scaled)
-        self.video_label.setPixmap(self._display_pixmap)
+        if self.video_gl is not None:
+            self._release_frame(self.video_gl.set_image(qimage))
+            return
+
+        frame_size = qimage.size()
+        target = self._target_size
+        if frame_size.width() <= target.width() and frame_size.height() <= target.height():
+            # Already fits the label: skip the scaled copy and show it at native size.
+            scaled = qimage
+        else:
+            scaled = qimage.scaled(
+                target,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation,
+            )
+
+        # Ping-pong: the label holds the other pixmap, so this one is unshared and
+        # convertFromImage can refill its backing store in place at a stable size.
+        pixmap = self._pixmaps[self._pixmap_index]
+        self._pixmap_index ^= 1
+        pixmap.convertFromImage(scaled)
+        self.video_label.setPixmap(pixmap)
+        del scaled
+        self._release_frame(qimage)
+
+    def _release_frame(self, qimage):
+        # Pooled frames go back to the NDI thread's pool (locked) once nothing reads them.
+        thread = self.thread
+        if qimage is not None and thread is not None:
+            thread.release_frame(qimage)
+
+    def eventFilter(self, obj, event):
+        if obj is self.video_label and event.type() == QEvent.Type.Resize:
+            self._target_size = event.size()
+        return super().eventFilter(obj, event)
 
     def _report(self):
+        try:
+            self._write_report()
+        finally:
+            if self.report_timer is not None:
+                self.report_timer.start(self._report_interval_ms)
+
+    def _write_report(self):
         now = time.time()
         elapsed = now - self.start_time
         fps = self.frame_count / elapsed if elapsed > 0 else 0.0
@@ -411,7 +662,7 @@ class NDITestWindow(QMainWindow):
             delta = rss - self.baseline_rss
             step = rss - self.last_rss
             self.last_rss = rss
-            self.rss_samples.append((elapsed, rss))
+            self._append_rss_sample(elapsed, rss)
             print(
                 f"t={elapsed:6.1f}s frames={self.frame_count:7d} fps={fps:6.1f} "
                 f"rss={rss:7.1f}MB delta={delta:+7.1f}MB step={step:+6.1f}MB"
@@ -422,12 +673,32 @@ class NDITestWindow(QMainWindow):
         else:
             print(f"t={elapsed:6.1f}s frames={self.frame_count:7d} fps={fps:6.1f}")
 
+    def _append_rss_sample(self, elapsed: float, rss: float) -> None:
+        if self._n == len(self._rss_ts):
+            # Timer slack can add a tick or two past the planned capacity
+            self._rss_ts = np.resize(self._rss_ts, self._n * 2)
+            self._rss_mb = np.resize(self._rss_mb, self._n * 2)
+        self._rss_ts[self._n] = elapsed
+        self._rss_mb[self._n] = rss
+        self._n += 1
+        self.rss_stats.add(rss)
+        if elapsed >= self.args.warmup_sec:
+            self.steady_rss_stats.add(rss)
+
+    def rss_series(self) -> tuple[np.ndarray, np.ndarray]:
+        """Recorded (elapsed seconds, RSS MB) samples as array views."""
+        return self._rss_ts[: self._n], self._rss_mb[: self._n]
+
     def closeEvent(self, event):
         try:
             self.report_timer.stop()
+            self.report_timer = None
             self.stop_timer.stop()
-            self.render_timer.stop()
-            self._display_pixmap = QPixmap()
+            self._release_frame(self._latest_frame.take())
+            if self.video_gl is not None:
+                self._release_frame(self.video_gl.set_image(None))
+            else:
+                self.video_label.clear()
 
             if self.thread:
                 self.thread.stop()
@@ -439,47 +710,42 @@ class NDITestWindow(QMainWindow):
 
 
 def compute_tail_slope_mb_per_min(
-    samples: list[tuple[float, float]], tail_sec: float = 30.0
+    ts: np.ndarray, rss: np.ndarray, tail_sec: float = 30.0
 ) -> float | None:
-    if len(samples) < 2:
+    n = len(ts)
+    if n < 2:
         return None
-    end_t = samples[-1][0]
-    start_t = max(0.0, end_t - tail_sec)
-    tail = [s for s in samples if s[0] >= start_t]
-    if len(tail) < 2:
-        tail = samples[-2:]
-
-    t0, r0 = tail[0]
-    t1, r1 = tail[-1]
-    dt = t1 - t0
+    end_t = ts[-1]
+    first = int(np.searchsorted(ts, max(0.0, end_t - tail_sec), side="left"))
+    if n - first < 2:
+        first = n - 2
+
+    dt = end_t - ts[first]
     if dt <= 0:
         return None
-    return (r1 - r0) / (dt / 60.0)
+    return float((rss[-1] - rss[first]) / (dt / 60.0))
 
 
 def samples_after_warmup(
-    samples: list[tuple[float, float]],
+    ts: np.ndarray,
+    rss: np.ndarray,
     warmup_sec: float,
-) -> list[tuple[float, float]]:
-    if not samples:
-        return []
-
-    filtered = [sample for sample in samples if sample[0] >= max(0.0, warmup_sec)]
-    if len(filtered) >= 2:
-        return filtered
+) -> tuple[np.ndarray, np.ndarray]:
+    first = int(np.searchsorted(ts, max(0.0, warmup_sec), side="left"))
+    if len(ts) - first >= 2:
+        return ts[first:], rss[first:]
 
-    return samples
+    return ts, rss
 
 
 def classify_memory_behavior(
-    samples: list[tuple[float, float]],
+    stats: RunningStats,
     tail_slope_mb_per_min: float | None,
 ) -> str:
-    if len(samples) < 3 or tail_slope_mb_per_min is None:
+    if stats.count < 3 or tail_slope_mb_per_min is None:
         return "insufficient-data"
 
-    rss_values = [rss for _, rss in samples]
-    rss_band = max(rss_values) - min(rss_values)
+    rss_band = stats.band
 
     # Heuristic interpretation:
     # - <= 0.25 MB/min in tail: plateau/steady churn
@@ -493,14 +759,14 @@ def classify_memory_behavior(
 
 
 def memory_analysis_ready(
-    samples: list[tuple[float, float]],
+    ts: np.ndarray,
     warmup_sec: float,
     min_analysis_sec: float = 60.0,
 ) -> tuple[bool, str]:
-    if len(samples) < 3:
+    if len(ts) < 3:
         return (False, "insufficient-data (too-few-samples)")
 
-    total_duration = samples[-1][0]
+    total_duration = float(ts[-1])
     if total_duration < max(min_analysis_sec, warmup_sec + 15.0):
         return (
             False,
@@ -517,8 +783,25 @@ def main() -> int:
         print("NDI not available. Install NDI Runtime and verify wrapper import.")
         return 1
 
+    stop_requested = threading.Event()
+    win = None
+
+    def _handle_signal(_sig, _frame):
+        stop_requested.set()
+        if win is not None:
+            # Handlers run on the main thread between Qt events; close via the loop.
+            QTimer.singleShot(0, win.close)
+
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+
     configure_interface(args)
-    candidates = choose_source_candidates(args)
+    candidates = choose_source_candidates(args, stop_requested)
+    if stop_requested.is_set():
+        print("Interrupted during source selection.")
+        ndi_video.cleanup_ndi()
+        return 1
+
     source_name = pick_verified_source(args, candidates)
     if not source_name:
         print("No responsive source available for UI test.")
@@ -527,15 +810,6 @@ def main() -> int:
 
     print(f"Using source: {source_name}")
 
-    stop_requested = False
-
-    def _handle_signal(_sig, _frame):
-        nonlocal stop_requested
-        stop_requested = True
-
-    signal.signal(signal.SIGINT, _handle_signal)
-    signal.signal(signal.SIGTERM, _handle_signal)
-
     app = QApplication(sys.argv)
     win = NDITestWindow(source_name, args)
     win.show()
@@ -556,26 +830,24 @@ def main() -> int:
             f"delta={end_rss - win.baseline_rss:+.1f}MB"
         )
 
-        if win.rss_samples:
-            analysis_ready, analysis_note = memory_analysis_ready(
-                win.rss_samples,
-                args.warmup_sec,
-            )
-            rss_values = [rss for _, rss in win.rss_samples]
-            rss_min = min(rss_values)
-            rss_max = max(rss_values)
-            rss_avg = sum(rss_values) / len(rss_values)
-            tail_slope = compute_tail_slope_mb_per_min(win.rss_samples, tail_sec=30.0)
+        ts, rss_values = win.rss_series()
+        if len(ts):
+            analysis_ready, analysis_note = memory_analysis_ready(ts, args.warmup_sec)
+            rss_stats = win.rss_stats
+            rss_min = rss_stats.minimum
+            rss_max = rss_stats.maximum
+            rss_avg = rss_stats.mean
+            tail_slope = compute_tail_slope_mb_per_min(ts, rss_values, tail_sec=30.0)
             verdict = (
-                classify_memory_behavior(win.rss_samples, tail_slope)
-                if analysis_ready
-                else analysis_note
+                classify_memory_behavior(rss_stats, tail_slope) if analysis_ready else analysis_note
             )
 
-            steady_samples = samples_after_warmup(win.rss_samples, args.warmup_sec)
-            steady_tail_slope = compute_tail_slope_mb_per_min(steady_samples, tail_sec=30.0)
+            steady_ts, steady_rss = samples_after_warmup(ts, rss_values, args.warmup_sec)
+            # samples_after_warmup falls back to the whole run when too few remain
+            steady_stats = win.steady_rss_stats if len(steady_ts) != len(ts) else rss_stats
+            steady_tail_slope = compute_tail_slope_mb_per_min(steady_ts, steady_rss, tail_sec=30.0)
             steady_verdict = (
-                classify_memory_behavior(steady_samples, steady_tail_slope)
+                classify_memory_behavior(steady_stats, steady_tail_slope)
                 if analysis_ready
                 else analysis_note
             )
@@ -587,10 +859,9 @@ def main() -> int:
             if tail_slope is not None:
                 print(f"RSS tail_slope(30s)={tail_slope:+.2f} MB/min")
             print(f"Memory verdict: {verdict}")
-            if len(steady_samples) != len(win.rss_samples):
+            if len(steady_ts) != len(ts):
                 print(
-                    f"Steady-state samples: {len(steady_samples)}/{len(win.rss_samples)} "
-                    f"(warmup={args.warmup_sec}s)"
+                    f"Steady-state samples: {len(steady_ts)}/{len(ts)} (warmup={args.warmup_sec}s)"
                 )
                 if steady_tail_slope is not None:
                     print(f"Steady-state RSS tail_slope(30s)={steady_tail_slope:+.2f} MB/min")
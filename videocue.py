@@ -3,13 +3,22 @@
 VideoCue - Multi-camera PTZ controller with VISCA-over-IP and NDI streaming
 """
 
+from __future__ import annotations
+
+import atexit
+import contextlib
 import logging
+import logging.config
+import logging.handlers
 import os
+import queue
 import subprocess
 import sys
+import time
 import traceback
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Configure DLL search path for PyInstaller bundles (Windows only)
 # PyInstaller 6.x places native DLLs in _internal subfolder
@@ -22,29 +31,139 @@ if sys.platform == "win32" and hasattr(sys, "_MEIPASS"):
         # Add _internal to PATH for DLL loading (avoids os.add_dll_directory crashes)
         os.environ["PATH"] = str(internal_path) + os.pathsep + os.environ.get("PATH", "")
 
-from PyQt6.QtCore import QEvent, Qt  # type: ignore
-from PyQt6.QtGui import QIcon  # type: ignore
-from PyQt6.QtWidgets import QApplication, QDialog, QMessageBox  # type: ignore
-
 from videocue import __version__
-from videocue.exceptions import VideoCueError
 from videocue.ui_strings import UIStrings
+from videocue.utils import get_app_data_dir, resource_path
 
-# Import qdarkstyle for dark theme
-try:
-    import qdarkstyle
-
-    has_dark_style = True
-except ImportError:
-    has_dark_style = False
-    # Logged after logging setup in main()
+# Qt, qdarkstyle and MainWindow (which pulls in NDI/VISCA controllers) are imported
+# inside the functions that use them, so the Windows supervisor process, which
+# never creates a QApplication, starts without loading any of them.
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QIcon  # type: ignore
+    from PyQt6.QtWidgets import QApplication, QDialog, QMessageBox, QSplashScreen  # type: ignore
 
-from videocue.ui.main_window import MainWindow
-from videocue.utils import get_app_data_dir, resource_path
+logger = logging.getLogger(__name__)
 
 RESTART_REQUEST_WITH_NDI_EXIT_CODE = 86
 RESTART_REQUEST_WITHOUT_NDI_EXIT_CODE = 87
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that builds the asctime text once per second instead of per record."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = -1
+        self._cached_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
+            )
+            self._cached_second = second
+        if datefmt:
+            return self._cached_time
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that writes into a 64 KB buffer and leaves flushing to
+    _BatchingQueueListener.
+
+    The size check keeps a running character count instead of seek()/tell(), which
+    would flush the buffer on every record.
+    """
+
+    buffer_size = 65536
+
+    def __init__(self, *args, **kwargs):
+        self._size = 0
+        self._in_emit = False
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        # Stays open until the handler closes it
+        stream = Path(self.baseFilename).open(  # noqa: SIM115
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        length = len(self.format(record)) + len(self.terminator)
+        if self.maxBytes > 0 and self._size + length >= self.maxBytes:
+            return True
+        self._size += length
+        return False
+
+    def emit(self, record):
+        self._in_emit = True
+        try:
+            super().emit(record)
+        finally:
+            self._in_emit = False
+
+    def flush(self):
+        # StreamHandler.emit() flushes after every record; skip that one.
+        if not self._in_emit:
+            super().flush()
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs empty."""
+
+    def dequeue(self, block):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
+    def stop(self):
+        super().stop()
+        for handler in self.handlers:
+            handler.flush()
+
+
+# Background writer for videocue.log (set by setup_logging when file logging is enabled)
+_file_log_listener: logging.handlers.QueueListener | None = None
+
+
+def _flush_file_log() -> None:
+    """Write queued log records to videocue.log (before crash reporting)."""
+    if _file_log_listener is not None:
+        with contextlib.suppress(Exception):
+            # stop() drains the queue and joins the writer thread; start a fresh one
+            _file_log_listener.stop()
+            _file_log_listener.start()
+
+
+def _queued_file_handler(filename: str) -> logging.handlers.QueueHandler:
+    """dictConfig factory: log calls only enqueue, a listener thread writes the file."""
+    global _file_log_listener
+
+    file_handler = _BufferedRotatingFileHandler(
+        filename, maxBytes=5_000_000, backupCount=3, encoding="utf-8", delay=True
+    )
+    # The QueueHandler itself stays unformatted; formatting it too would prefix twice.
+    file_handler.setFormatter(_CachedTimeFormatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _file_log_listener = _BatchingQueueListener(log_queue, file_handler, respect_handler_level=True)
+    _file_log_listener.start()
+    # Registered after logging's own shutdown hook, so it runs first and the queue is
+    # drained before handlers are closed.
+    atexit.register(_file_log_listener.stop)
+    return logging.handlers.QueueHandler(log_queue)
+
 
 def _write_crash_log(
     reason: str,
@@ -58,6 +177,7 @@ def _write_crash_log(
     Returns:
         Path to the crash log file that was created.
     """
+    _flush_file_log()
     timestamp = datetime.now().isoformat(timespec="seconds")
     process_role = os.environ.get("VIDEOCUE_PROCESS_ROLE", "direct")
     ndi_disabled = os.environ.get("VIDEOCUE_DISABLE_NDI") == "1"
@@ -108,6 +228,9 @@ def _write_crash_log(
 
 def _apply_popup_window_policy(dialog: QDialog) -> None:
     """Force popup dialogs to show only Close button (no minimize/maximize)."""
+    from PyQt6.QtCore import Qt  # type: ignore
+    from PyQt6.QtWidgets import QMessageBox  # type: ignore
+
     try:
         dialog.setWindowFlag(Qt.WindowType.CustomizeWindowHint, True)
         dialog.setWindowFlag(Qt.WindowType.WindowTitleHint, True)
@@ -121,12 +244,8 @@ def _apply_popup_window_policy(dialog: QDialog) -> None:
 
         if isinstance(dialog, QMessageBox):
             dialog.setSizeGripEnabled(False)
-
-        # Re-show if needed so updated flags are applied by the window manager.
-        if dialog.isVisible():
-            dialog.show()
     except Exception:
-        logging.getLogger(__name__).debug("Failed applying popup window policy", exc_info=True)
+        logger.debug("Failed applying popup window policy", exc_info=True)
 
 
 def _show_native_error_dialog(title: str, message: str) -> None:
@@ -181,6 +300,8 @@ def _show_native_restart_dialog(title: str, message: str) -> str:
 
 def _request_restart(disable_ndi: bool) -> None:
     """Exit the app with a supervisor restart request exit code."""
+    from PyQt6.QtWidgets import QApplication  # type: ignore
+
     exit_code = (
         RESTART_REQUEST_WITHOUT_NDI_EXIT_CODE if disable_ndi else RESTART_REQUEST_WITH_NDI_EXIT_CODE
     )
@@ -192,14 +313,65 @@ def _request_restart(disable_ndi: bool) -> None:
     raise SystemExit(exit_code)
 
 
-def _show_exception_restart_dialog(
-    title: str, exc_type: type[BaseException], exc_value: BaseException, detailed_trace: str
-) -> str:
-    """Show exception details and restart choices."""
+_app_icon_cache: QIcon | None = None
+_app_icon_resolved = False
+
+
+def _app_icon() -> QIcon | None:
+    """Return the application icon, loaded once; None when the icon file is missing."""
+    global _app_icon_cache, _app_icon_resolved
+    if not _app_icon_resolved:
+        icon_path = resource_path("resources/icon.png")
+        if Path(icon_path).exists():
+            from PyQt6.QtGui import QIcon  # type: ignore
+
+            _app_icon_cache = QIcon(icon_path)
+        _app_icon_resolved = True
+    return _app_icon_cache
+
+
+def _make_error_box(title: str, text: str, detail: str | None = None) -> QMessageBox:
+    """Build a critical QMessageBox carrying the application icon."""
+    from PyQt6.QtWidgets import QMessageBox  # type: ignore
+
     msg_box = QMessageBox()
     msg_box.setIcon(QMessageBox.Icon.Critical)
     msg_box.setWindowTitle(title)
+    msg_box.setText(text)
+    if detail:
+        msg_box.setDetailedText(detail)
+    icon = _app_icon()
+    if icon is not None:
+        msg_box.setWindowIcon(icon)
+    return msg_box
+
+
+# Reused for every unhandled exception so a handler that fails repeatedly does not
+# build (and lay out) a new dialog each time
+_exception_box: QMessageBox | None = None
+
+
+def _show_exception_restart_dialog(
+    title: str, exc_type: type[BaseException], exc_value: BaseException, detail_prefix: str = ""
+) -> str | None:
+    """Show exception details and restart choices.
+
+    The traceback for the details pane is only formatted once the dialog is known to
+    be shown. Returns None without showing anything while the dialog is already open
+    (an exception raised from inside its own event loop).
+    """
+    global _exception_box
+    from PyQt6.QtWidgets import QMessageBox  # type: ignore
 
+    if _exception_box is not None and _exception_box.isVisible():
+        return None
+
+    # Frames are walked once, without capturing locals
+    detailed_trace = detail_prefix + "".join(
+        traceback.TracebackException(
+            exc_type, exc_value, exc_value.__traceback__, capture_locals=False
+        ).format()
+    )
     message_text = str(exc_value).strip() or "(no message)"
     summary = "\n".join(
         [
@@ -209,34 +381,53 @@ def _show_exception_restart_dialog(
             UIStrings.ERROR_RESTART_PROMPT,
         ]
     )
-    msg_box.setText(summary)
-    msg_box.setDetailedText(detailed_trace)
 
-    restart_with_ndi = msg_box.addButton(
-        UIStrings.BTN_RESTART_WITH_NDI,
-        QMessageBox.ButtonRole.AcceptRole,
-    )
-    restart_without_ndi = msg_box.addButton(
-        UIStrings.BTN_RESTART_WITHOUT_NDI,
-        QMessageBox.ButtonRole.DestructiveRole,
-    )
-    exit_button = msg_box.addButton(
-        UIStrings.BTN_EXIT_APP,
-        QMessageBox.ButtonRole.RejectRole,
-    )
-    msg_box.setDefaultButton(restart_with_ndi)
-    msg_box.exec()
+    if _exception_box is None:
+        _exception_box = _make_error_box(title, summary, detailed_trace)
+        restart_with_ndi = _exception_box.addButton(
+            UIStrings.BTN_RESTART_WITH_NDI,
+            QMessageBox.ButtonRole.AcceptRole,
+        )
+        _exception_box.addButton(
+            UIStrings.BTN_RESTART_WITHOUT_NDI,
+            QMessageBox.ButtonRole.DestructiveRole,
+        )
+        _exception_box.addButton(
+            UIStrings.BTN_EXIT_APP,
+            QMessageBox.ButtonRole.RejectRole,
+        )
+        _exception_box.setDefaultButton(restart_with_ndi)
+    else:
+        _exception_box.setWindowTitle(title)
+        _exception_box.setText(summary)
+        _exception_box.setDetailedText(detailed_trace)
+
+    _exception_box.exec()
 
-    clicked = msg_box.clickedButton()
-    if clicked == restart_with_ndi:
+    role = _exception_box.buttonRole(_exception_box.clickedButton())
+    if role == QMessageBox.ButtonRole.AcceptRole:
         return "restart_with_ndi"
-    if clicked == restart_without_ndi:
+    if role == QMessageBox.ButtonRole.DestructiveRole:
         return "restart_without_ndi"
-    if clicked == exit_button:
-        return "exit"
     return "exit"
 
 
+def _handle_exception_action(action: str | None) -> None:
+    """Carry out the choice made in the exception restart dialog."""
+    from PyQt6.QtWidgets import QApplication  # type: ignore
+
+    if action is None:
+        return
+    if action == "restart_with_ndi":
+        _request_restart(disable_ndi=False)
+    elif action == "restart_without_ndi":
+        _request_restart(disable_ndi=True)
+    else:
+        app = QApplication.instance()
+        if app is not None:
+            app.exit(1)
+
+
 def _is_abnormal_exit(exit_code: int) -> bool:
     """Return True for likely crash exits (native fault or terminated by signal)."""
     if exit_code == 0:
@@ -255,6 +446,31 @@ def _is_abnormal_exit(exit_code: int) -> bool:
     return False
 
 
+def _launch_command(args: list[str]) -> list[str]:
+    """Command line that starts this application again with the given arguments."""
+    if getattr(sys, "frozen", False):
+        return [sys.executable, *args]
+    return [sys.executable, str(Path(__file__).resolve()), *args]
+
+
+def _prompt_restart_after_crash(crash_log_path: Path, exit_code: int | None = None) -> str:
+    """Tell the user the app crashed and ask how to restart it."""
+    details = f"{UIStrings.ERROR_NATIVE_CRASH_PROMPT}\n\n"
+    if exit_code is not None:
+        details += f"{UIStrings.ERROR_APP_EXIT_CODE.format(code=exit_code)}\n"
+    details += UIStrings.ERROR_APP_LOG_PATH.format(path=crash_log_path)
+    return _show_native_restart_dialog(UIStrings.ERROR_CRITICAL, details)
+
+
+def _report_launch_failure(reason: str, error: Exception) -> None:
+    """Log and show a failure to start the application process."""
+    _write_crash_log(reason, type(error), error, error.__traceback__)
+    _show_native_error_dialog(
+        UIStrings.ERROR_CRITICAL,
+        f"{UIStrings.ERROR_APP_LAUNCH_FAILED}: {UIStrings.APP_NAME}.\n\n{error}",
+    )
+
+
 def _run_with_supervisor() -> int:
     """Run app in a child process and report abnormal crashes to the user."""
     child_args = [arg for arg in sys.argv[1:] if arg != "--child-process"]
@@ -266,16 +482,7 @@ def _run_with_supervisor() -> int:
         if disable_ndi:
             child_env["VIDEOCUE_DISABLE_NDI"] = "1"
 
-        if getattr(sys, "frozen", False):
-            command = [sys.executable, *child_args, "--child-process"]
-        else:
-            command = [
-                sys.executable,
-                str(Path(__file__).resolve()),
-                *child_args,
-                "--child-process",
-            ]
-
+        command = _launch_command([*child_args, "--child-process"])
         return subprocess.run(command, env=child_env, check=False)
 
     disable_ndi_for_next_run = False
@@ -284,16 +491,7 @@ def _run_with_supervisor() -> int:
         try:
             completed = run_child(disable_ndi=disable_ndi_for_next_run)
         except Exception as e:
-            _write_crash_log(
-                "Supervisor failed launching child process",
-                type(e),
-                e,
-                e.__traceback__,
-            )
-            _show_native_error_dialog(
-                UIStrings.ERROR_CRITICAL,
-                f"{UIStrings.ERROR_APP_LAUNCH_FAILED}: {UIStrings.APP_NAME}.\n\n{e}",
-            )
+            _report_launch_failure("Supervisor failed launching child process", e)
             return 1
 
         exit_code = completed.returncode
@@ -314,14 +512,7 @@ def _run_with_supervisor() -> int:
                     f"Child launch mode NDI disabled: {disable_ndi_for_next_run}"
                 ),
             )
-            action = _show_native_restart_dialog(
-                UIStrings.ERROR_CRITICAL,
-                (
-                    f"{UIStrings.ERROR_NATIVE_CRASH_PROMPT}\n\n"
-                    f"{UIStrings.ERROR_APP_EXIT_CODE.format(code=exit_code)}\n"
-                    f"{UIStrings.ERROR_APP_LOG_PATH.format(path=crash_log_path)}"
-                ),
-            )
+            action = _prompt_restart_after_crash(crash_log_path, exit_code)
 
             if action == "restart_with_ndi":
                 disable_ndi_for_next_run = False
@@ -336,6 +527,143 @@ def _run_with_supervisor() -> int:
         return exit_code
 
 
+class _CrashMarker:
+    """Per-process marker file that only survives an abnormal exit (Windows).
+
+    The file is locked for the life of the process; Windows drops the lock when the
+    process dies, so an unlocked marker left on disk means that session crashed.
+    """
+
+    PATTERN = "crash-*.flag"
+
+    def __init__(self):
+        self.path = get_app_data_dir() / f"crash-{os.getpid()}.flag"
+        self._fd = None
+
+    def create(self, ndi_disabled: bool) -> None:
+        import msvcrt
+
+        try:
+            # Stays open (and locked) until remove(); see class docstring.
+            self._fd = self.path.open("w", encoding="utf-8")  # noqa: SIM115
+            msvcrt.locking(self._fd.fileno(), msvcrt.LK_NBLCK, 1)
+            self._fd.write(
+                f"pid={os.getpid()}\n"
+                f"started={datetime.now().isoformat(timespec='seconds')}\n"
+                f"ndi_disabled={ndi_disabled}\n"
+            )
+            self._fd.flush()
+        except OSError as e:
+            logger.debug(f"Could not create crash marker: {e}")
+            self.remove()
+
+    def remove(self) -> None:
+        if self._fd is not None:
+            import msvcrt
+
+            with contextlib.suppress(OSError):
+                self._fd.seek(0)
+                msvcrt.locking(self._fd.fileno(), msvcrt.LK_UNLCK, 1)
+            with contextlib.suppress(OSError):
+                self._fd.close()
+            self._fd = None
+        with contextlib.suppress(OSError):
+            self.path.unlink(missing_ok=True)
+
+    @classmethod
+    def collect_stale(cls) -> list[str]:
+        """Remove markers left by crashed sessions and return their contents."""
+        import msvcrt
+
+        stale: list[str] = []
+        for marker in get_app_data_dir().glob(cls.PATTERN):
+            try:
+                with marker.open("r+", encoding="utf-8") as handle:
+                    # Fails while the owning process is still running.
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                    stale.append(handle.read().strip())
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+                marker.unlink()
+            except OSError:
+                continue
+        return stale
+
+
+def _run_in_process() -> int:
+    """Run the app in this process; report a crashed previous session on startup.
+
+    Replaces the supervisor child process for normal launches. Native crashes are
+    still captured by faulthandler, and the crash marker lets the next launch offer
+    the same restart-with/without-NDI choice the supervisor showed.
+    """
+    stale_sessions = _CrashMarker.collect_stale()
+    if stale_sessions:
+        crash_log_path = _write_crash_log(
+            "Previous session ended abnormally",
+            extra_details="\n\n".join(stale_sessions),
+        )
+        action = _prompt_restart_after_crash(crash_log_path)
+        if action == "exit":
+            return 1
+        if action == "restart_without_ndi":
+            os.environ["VIDEOCUE_DISABLE_NDI"] = "1"
+
+    marker = _CrashMarker()
+    marker.create(ndi_disabled=os.environ.get("VIDEOCUE_DISABLE_NDI") == "1")
+    try:
+        exit_code = main()
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    finally:
+        marker.remove()
+
+    if exit_code in (RESTART_REQUEST_WITH_NDI_EXIT_CODE, RESTART_REQUEST_WITHOUT_NDI_EXIT_CODE):
+        # NDI availability is fixed at import time, so restarts need a fresh process.
+        restart_env = os.environ.copy()
+        restart_env.pop("VIDEOCUE_DISABLE_NDI", None)
+        if exit_code == RESTART_REQUEST_WITHOUT_NDI_EXIT_CODE:
+            restart_env["VIDEOCUE_DISABLE_NDI"] = "1"
+        try:
+            subprocess.Popen(_launch_command(sys.argv[1:]), env=restart_env)
+        except OSError as e:
+            _report_launch_failure("Failed relaunching application", e)
+            return 1
+        return 0
+
+    return exit_code
+
+
+def _logging_config(log_file: Path, file_logging_enabled: bool) -> dict:
+    """Build the dictConfig schema for console (and optionally queued file) logging."""
+    root_handlers = ["console"]
+    handlers: dict[str, dict] = {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "default",
+            "stream": "ext://sys.stdout",
+        },
+    }
+    if file_logging_enabled:
+        # File writes run on a QueueListener thread, keeping disk I/O off the GUI thread.
+        handlers["file"] = {"()": _queued_file_handler, "filename": str(log_file)}
+        root_handlers.append("file")
+
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "default": {"()": _CachedTimeFormatter, "fmt": LOG_FORMAT},
+        },
+        "handlers": handlers,
+        "loggers": {
+            "videocue.controllers.usb_controller": {"level": "WARNING"},
+            "videocue.controllers.ndi_video": {"level": "INFO"},
+        },
+        "root": {"level": "INFO", "handlers": root_handlers},
+    }
+
+
 def setup_logging(file_logging_enabled: bool = False, process_role: str = "direct") -> None:
     """Configure application logging
 
@@ -346,23 +674,8 @@ def setup_logging(file_logging_enabled: bool = False, process_role: str = "direc
     log_dir.mkdir(exist_ok=True)
     log_file = log_dir / "videocue.log"
 
-    # Build handlers list based on preference
-    handlers = [logging.StreamHandler(sys.stdout)]
-    if file_logging_enabled:
-        handlers.append(logging.FileHandler(log_file, mode="a", encoding="utf-8"))
-
-    # Configure root logger
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=handlers,
-    )
+    logging.config.dictConfig(_logging_config(log_file, file_logging_enabled))
 
-    # Set specific module levels
-    logging.getLogger("videocue.controllers.usb_controller").setLevel(logging.WARNING)
-    logging.getLogger("videocue.controllers.ndi_video").setLevel(logging.INFO)
-
-    logger = logging.getLogger(__name__)
     logger.info("=" * 60)
     logger.info(f"Process role: {process_role}")
 
@@ -394,83 +707,114 @@ def exception_hook(exc_type, exc_value, exc_traceback):
         return
 
     # Log the exception
-    logger = logging.getLogger(__name__)
     logger.critical("Unhandled exception", exc_info=(exc_type, exc_value, exc_traceback))
     _write_crash_log("Unhandled Python exception", exc_type, exc_value, exc_traceback)
 
-    # Format the exception
-    error_msg = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
-
     # Determine error severity
+    from videocue.exceptions import VideoCueError
+
     error_title = UIStrings.ERROR_CRITICAL
     if issubclass(exc_type, VideoCueError):
         error_title = f"{type(exc_value).__name__}"
 
+    from PyQt6.QtWidgets import QApplication  # type: ignore
+
+    app = QApplication.instance()
+    if app is None:
+        # No event loop yet (e.g. failure before main() created the app): a QMessageBox
+        # cannot be shown safely, so fall back to the native dialog.
+        _show_native_error_dialog(
+            error_title, "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+        )
+        return
+
     # Show error dialog to user
     try:
-        action = _show_exception_restart_dialog(error_title, exc_type, exc_value, error_msg)
-        if action == "restart_with_ndi":
-            _request_restart(disable_ndi=False)
-        elif action == "restart_without_ndi":
-            _request_restart(disable_ndi=True)
-        else:
-            app = QApplication.instance()
-            if app is not None:
-                app.exit(1)
+        _handle_exception_action(_show_exception_restart_dialog(error_title, exc_type, exc_value))
     except Exception:
         # If even the error dialog fails, just log it
         logger.exception("Failed to show error dialog")
 
 
-class ExceptionHandlingApplication(QApplication):
-    """QApplication subclass that catches Qt event exceptions"""
+_exception_handling_application_class: type[QApplication] | None = None
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.logger = logging.getLogger(__name__)
 
-    def notify(self, receiver, event) -> bool:
-        """Override notify to catch exceptions in Qt event handlers"""
-        try:
-            # Enforce popup window buttons globally (covers static QMessageBox helpers too).
-            if (
-                isinstance(receiver, QDialog)
-                and event is not None
-                and event.type() in (QEvent.Type.Polish, QEvent.Type.Show)
-            ):
-                _apply_popup_window_policy(receiver)
-
-            return super().notify(receiver, event)
-        except KeyboardInterrupt:
-            # Let Ctrl+C exit cleanly
-            raise
-        except Exception as e:
-            error_msg = f"Exception in Qt event handler: {str(e)}"
-            self.logger.exception(error_msg)
-            exc_type = type(e)
-            _write_crash_log("Qt event handler exception", exc_type, e, e.__traceback__)
+def _get_exception_handling_application_class() -> type[QApplication]:
+    """Define ExceptionHandlingApplication on first use (keeps Qt out of module import)."""
+    global _exception_handling_application_class
+    if _exception_handling_application_class is not None:
+        return _exception_handling_application_class
 
-            # Show error dialog
+    import weakref
+
+    from PyQt6.QtCore import QEvent  # type: ignore
+    from PyQt6.QtWidgets import QApplication, QDialog  # type: ignore
+
+    polish_event = QEvent.Type.Polish
+
+    class ExceptionHandlingApplication(QApplication):
+        """QApplication subclass that catches Qt event exceptions"""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.logger = logger
+            # Dialogs that already had the popup window policy applied
+            self._policed_dialogs: weakref.WeakSet = weakref.WeakSet()
+
+        def notify(self, receiver, event) -> bool:
+            """Override notify to catch exceptions in Qt event handlers"""
             try:
-                action = _show_exception_restart_dialog(
-                    UIStrings.ERROR_QT_EVENT,
-                    exc_type,
-                    e,
-                    f"{error_msg}\n\n{traceback.format_exc()}",
-                )
-                if action == "restart_with_ndi":
-                    _request_restart(disable_ndi=False)
-                elif action == "restart_without_ndi":
-                    _request_restart(disable_ndi=True)
-                else:
-                    app = QApplication.instance()
-                    if app is not None:
-                        app.exit(1)
-            except Exception:
-                self.logger.exception("Failed to show Qt event error dialog")
-
-            # Don't crash, return False to indicate event wasn't handled
-            return False
+                # Enforce popup window buttons globally (covers static QMessageBox helpers too).
+                # Polish arrives once, just before a dialog is first shown, so the flags
+                # are in place without recreating an already visible native window.
+                if (
+                    event is not None
+                    and event.type() == polish_event
+                    and isinstance(receiver, QDialog)
+                    and receiver not in self._policed_dialogs
+                ):
+                    self._policed_dialogs.add(receiver)
+                    _apply_popup_window_policy(receiver)
+
+                return super().notify(receiver, event)
+            except KeyboardInterrupt:
+                # Let Ctrl+C exit cleanly
+                raise
+            except Exception as e:
+                error_msg = f"Exception in Qt event handler: {str(e)}"
+                self.logger.exception(error_msg)
+                exc_type = type(e)
+                _write_crash_log("Qt event handler exception", exc_type, e, e.__traceback__)
+
+                # Show error dialog
+                try:
+                    _handle_exception_action(
+                        _show_exception_restart_dialog(
+                            UIStrings.ERROR_QT_EVENT,
+                            exc_type,
+                            e,
+                            f"{error_msg}\n\n",
+                        )
+                    )
+                except Exception:
+                    self.logger.exception("Failed to show Qt event error dialog")
+
+                # Don't crash, return False to indicate event wasn't handled
+                return False
+
+    _exception_handling_application_class = ExceptionHandlingApplication
+    return ExceptionHandlingApplication
+
+
+def __getattr__(name: str):
+    """Resolve Qt-backed names lazily for code that imports them from this module."""
+    if name == "ExceptionHandlingApplication":
+        return _get_exception_handling_application_class()
+    if name == "MainWindow":
+        from videocue.ui.main_window import MainWindow
+
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SingleInstanceLock:
@@ -478,10 +822,14 @@ class SingleInstanceLock:
 
     def __init__(self):
         """Initialize the lock file path"""
-        from videocue.utils import get_app_data_dir
+        from PyQt6.QtCore import QLockFile  # type: ignore
 
         self.lock_file = get_app_data_dir() / "videocue.lock"
-        self.lock_fd = None
+        self._lock = QLockFile(str(self.lock_file))
+        # QLockFile records the owner's PID and treats the lock as stale once that
+        # process is gone (e.g. after a hard kill); disable the age-based fallback so
+        # a long-running instance is never mistaken for a stale one.
+        self._lock.setStaleLockTime(0)
 
     def acquire(self) -> bool:
         """Attempt to acquire the instance lock.
@@ -489,79 +837,89 @@ class SingleInstanceLock:
         Returns:
             bool: True if lock acquired successfully, False if another instance is running
         """
-        try:
-            # Try to open the lock file exclusively
-            if os.name == "nt":  # Windows
-                import msvcrt
+        if self._lock.tryLock(0):
+            return True
 
-                try:
-                    # Create or open the lock file
-                    # Note: Cannot use context manager (with statement) here because the file
-                    # must remain open for the lifetime of the application to maintain the lock.
-                    # The lock is released in release() method when app exits.
-                    self.lock_fd = self.lock_file.open("w")  # noqa: SIM115
-                    # Try to lock it exclusively (non-blocking)
-                    msvcrt.locking(self.lock_fd.fileno(), msvcrt.LK_NBLCK, 1)
-                    # Write PID to lock file
-                    self.lock_fd.write(str(os.getpid()))
-                    self.lock_fd.flush()
-                    return True
-                except OSError:
-                    # Lock failed - another instance is running
-                    if self.lock_fd:
-                        self.lock_fd.close()
-                        self.lock_fd = None
-                    return False
-            else:  # Unix/Linux/Mac
-                import fcntl
+        from PyQt6.QtCore import QLockFile  # type: ignore
 
-                try:
-                    # Create or open the lock file
-                    # Note: Cannot use context manager (with statement) here because the file
-                    # must remain open for the lifetime of the application to maintain the lock.
-                    # The lock is released in release() method when app exits.
-                    self.lock_fd = self.lock_file.open("w")  # noqa: SIM115
-                    # Try to lock it exclusively (non-blocking)
-                    fcntl.flock(self.lock_fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                    # Write PID to lock file
-                    self.lock_fd.write(str(os.getpid()))
-                    self.lock_fd.flush()
-                    return True
-                except OSError:
-                    # Lock failed - another instance is running
-                    if self.lock_fd:
-                        self.lock_fd.close()
-                        self.lock_fd = None
-                    return False
-        except Exception as e:
-            # If we can't create/access the lock file, allow the app to run
-            logging.getLogger(__name__).warning(f"Failed to check single instance lock: {e}")
-            return True
+        if self._lock.error() == QLockFile.LockError.LockFailedError:
+            # Lock held by a running process - another instance is running
+            return False
+
+        # If we can't create/access the lock file, allow the app to run
+        logger.warning(f"Failed to check single instance lock: {self._lock.error().name}")
+        return True
 
     def release(self):
-        """Release the instance lock"""
-        if self.lock_fd:
-            try:
-                if os.name == "nt":  # Windows
-                    import msvcrt
+        """Release the instance lock (removes the lock file)"""
+        if self._lock.isLocked():
+            self._lock.unlock()
 
-                    msvcrt.locking(self.lock_fd.fileno(), msvcrt.LK_UNLCK, 1)
-                else:  # Unix/Linux/Mac
-                    import fcntl
 
-                    fcntl.flock(self.lock_fd.fileno(), fcntl.LOCK_UN)
-                self.lock_fd.close()
-            except Exception:
-                pass  # Ignore errors during cleanup
-            finally:
-                self.lock_fd = None
+# Link colour qdarkstyle applies to the application palette (DarkPalette.COLOR_ACCENT_3);
+# the prebuilt QSS cannot carry palette changes, so it is applied here.
+_DARK_LINK_COLOR = "#1A72BB"
 
-        # Try to remove lock file
-        try:
-            if self.lock_file.exists():
-                self.lock_file.unlink()
-        except Exception:
-            pass  # Ignore errors during cleanup
+
+def _load_dark_stylesheet(app: QApplication) -> str | None:
+    """Return the dark theme stylesheet, or None when no theme is available.
+
+    Builds ship resources/dark.qss, generated by VideoCue.spec, so startup reads a plain
+    file instead of importing qdarkstyle. Source runs fall back to qdarkstyle itself.
+    """
+    qss_path = Path(resource_path("resources/dark.qss"))
+    if qss_path.exists():
+        from PyQt6.QtCore import QDir  # type: ignore
+        from PyQt6.QtGui import QColor, QPalette  # type: ignore
+
+        QDir.addSearchPath("qss_icons", resource_path("resources/qss_icons"))
+        palette = app.palette()
+        palette.setColor(
+            QPalette.ColorGroup.Normal, QPalette.ColorRole.Link, QColor(_DARK_LINK_COLOR)
+        )
+        app.setPalette(palette)
+        return qss_path.read_text(encoding="utf-8")
+
+    try:
+        import qdarkstyle
+    except ImportError:
+        return None
+    return qdarkstyle.load_stylesheet(qt_api="pyqt6")
+
+
+def _show_splash(app: QApplication) -> QSplashScreen:
+    """Show a startup splash and paint it before the main window modules are imported."""
+    from PyQt6.QtCore import QRect, Qt  # type: ignore
+    from PyQt6.QtGui import QColor, QFont, QPainter, QPixmap  # type: ignore
+    from PyQt6.QtWidgets import QSplashScreen  # type: ignore
+
+    pixmap = QPixmap(360, 140)
+    pixmap.fill(QColor("#19232D"))  # qdarkstyle window background
+    painter = QPainter(pixmap)
+    icon = _app_icon()
+    if icon is not None:
+        painter.drawPixmap(24, 38, icon.pixmap(64, 64))
+    font = QFont(app.font())
+    font.setPointSize(20)
+    font.setBold(True)
+    painter.setFont(font)
+    painter.setPen(QColor("#DFE1E2"))
+    painter.drawText(
+        QRect(104, 0, 240, 140),
+        Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+        UIStrings.APP_NAME,
+    )
+    painter.end()
+
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        UIStrings.SPLASH_STARTING,
+        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom,
+        QColor("#ACB1B6"),
+    )
+    splash.show()
+    app.processEvents()
+    return splash
 
 
 def main() -> int:
@@ -575,7 +933,6 @@ def main() -> int:
     # Setup logging with preference
     process_role = os.environ.get("VIDEOCUE_PROCESS_ROLE", "direct")
     setup_logging(file_logging_enabled, process_role=process_role)
-    logger = logging.getLogger(__name__)
     logger.info("Starting VideoCue application")
     ndi_disabled_for_session = os.environ.get("VIDEOCUE_DISABLE_NDI") == "1"
     if ndi_disabled_for_session:
@@ -590,6 +947,8 @@ def main() -> int:
         instance_lock = SingleInstanceLock()
         if not instance_lock.acquire():
             logger.warning("Another instance is already running")
+            from PyQt6.QtWidgets import QMessageBox  # type: ignore
+
             QMessageBox.warning(
                 None,
                 "VideoCue Already Running",
@@ -606,12 +965,8 @@ def main() -> int:
     else:
         logger.info("Single instance mode disabled - multiple instances allowed")
 
-    # Log theme availability
-    if not has_dark_style:
-        logger.warning("qdarkstyle not installed, using default theme")
-
-    # Install global exception handler
-    sys.excepthook = exception_hook
+    from PyQt6.QtCore import Qt  # type: ignore
+    from PyQt6.QtWidgets import QApplication  # type: ignore
 
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(
@@ -619,33 +974,52 @@ def main() -> int:
     )
 
     # Create application with custom exception handling
-    app = ExceptionHandlingApplication(sys.argv)
+    app = _get_exception_handling_application_class()(sys.argv)
     app.setApplicationName(UIStrings.APP_NAME)
     app.setOrganizationName(UIStrings.APP_NAME)
 
+    # Install global exception handler once there is an application to show dialogs;
+    # earlier failures use Python's default hook (stderr), as nothing is on screen yet.
+    sys.excepthook = exception_hook
+
     if ndi_disabled_for_session:
+        from PyQt6.QtWidgets import QMessageBox  # type: ignore
+
         QMessageBox.warning(
             None, UIStrings.ERROR_NDI_NOT_AVAILABLE, UIStrings.WARN_NDI_SESSION_DISABLED
         )
 
     # Set application icon
-    icon_path = resource_path("resources/icon.png")
-    if Path(icon_path).exists():
-        app.setWindowIcon(QIcon(icon_path))
+    icon = _app_icon()
+    if icon is not None:
+        app.setWindowIcon(icon)
+
+    # Paint a splash before the stylesheet and MainWindow (NDI/VISCA controllers) load
+    splash = _show_splash(app)
 
     # Apply dark theme if available
-    if has_dark_style:
-        app.setStyleSheet(qdarkstyle.load_stylesheet(qt_api="pyqt6"))
+    dark_stylesheet = _load_dark_stylesheet(app)
+    if dark_stylesheet is not None:
+        app.setStyleSheet(dark_stylesheet)
+    else:
+        logger.warning("Dark stylesheet not available, using default theme")
 
     # Create and show main window
     try:
+        from videocue.ui.main_window import MainWindow
+
         window = MainWindow()
         window.show()
+        splash.finish(window)
     except Exception as e:
-        error_msg = f"Failed to initialize application:\n{str(e)}\n\n{traceback.format_exc()}"
+        splash.close()
         logger.critical("Startup error", exc_info=True)
         _write_crash_log("Application startup failure", type(e), e, e.__traceback__)
-        QMessageBox.critical(None, "Startup Error", error_msg)
+        _make_error_box(
+            "Startup Error",
+            f"Failed to initialize application:\n{str(e)}",
+            traceback.format_exc(),
+        ).exec()
         if instance_lock:
             instance_lock.release()
         return 1
@@ -669,9 +1043,12 @@ if __name__ == "__main__":
     if "--child-process" in sys.argv:
         sys.argv = [arg for arg in sys.argv if arg != "--child-process"]
 
+    # The child-process supervisor costs a second interpreter start on every launch;
+    # it is kept for debugging behind VIDEOCUE_SUPERVISOR_FORCE=1.
     use_supervisor = (
         os.name == "nt"
         and not running_child
+        and os.environ.get("VIDEOCUE_SUPERVISOR_FORCE") == "1"
         and os.environ.get("VIDEOCUE_SUPERVISOR_DISABLED") != "1"
     )
 
@@ -679,4 +1056,7 @@ if __name__ == "__main__":
         os.environ["VIDEOCUE_PROCESS_ROLE"] = "supervisor"
         sys.exit(_run_with_supervisor())
 
+    if os.name == "nt" and not running_child:
+        sys.exit(_run_in_process())
+
     sys.exit(main())
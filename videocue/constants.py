@@ -11,9 +11,12 @@ class NetworkConstants:
         10000  # Initial discovery - allow time for all sources (CamControl uses longer timeouts)
     )
     NDI_DISCOVERY_QUICK_TIMEOUT_MS = 1500  # Quick rediscovery for cached sources
+    NDI_DISCOVERY_COALESCE_MS = 2000  # Reuse the global finder's list if it waited this recently
     NDI_FRAME_TIMEOUT_MS = 100
     NDI_NO_FRAME_THRESHOLD = 100  # frames before timeout (10 seconds at 100ms timeout)
+    NDI_RECONNECT_MAX_BACKOFF_S = 4.0  # Longest wait between no-frame reconnect attempts
     NDI_THREAD_STOP_TIMEOUT_S = 2.0  # seconds
+    NDI_FRAME_POOL_SIZE = 3  # Reused display buffers per stream (converting, queued, rendering)
     NDI_CONNECTION_RETRY_DELAY_MS = 500  # Delay before retry on connection failure
 
 
@@ -43,7 +46,7 @@ class HardwareConstants:
 class ViscaConstants:
     """VISCA protocol constants"""
 
-    SHUTTER_SPEEDS = [
+    SHUTTER_SPEEDS = (
         "Auto",
         "Manual",
         "1/10000",
@@ -67,4 +70,6 @@ class ViscaConstants:
         "1/15",
         "1/8",
         "1/4",
-    ]
+    )
+    # Fixed speeds (after "Auto" and "Manual"), indexed by the shutter slider position
+    MANUAL_SHUTTER_SPEEDS = SHUTTER_SPEEDS[2:]
@@ -2,11 +2,15 @@
 NDI video receiver with frame dropping for performance
 """
 
-import contextlib
+import gc
 import logging
 import math
 import os
+import queue
 import threading
+import time
+import tracemalloc
+from collections import OrderedDict
 from typing import Any
 
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
@@ -25,9 +29,21 @@ ndi_available = False
 ndi_error_message = ""
 _ndi_initialized = False
 _global_finder = None
-_ndi_lock = threading.Lock()  # Thread safety for global NDI resources
-_source_cache: dict = {}  # Cache of discovered sources {source_name: ndi.Source}
-_last_discovery_time = 0.0  # Track when we last did a full discovery
+_ndi_lock = threading.Lock()  # NDI initialize / global finder lifecycle and config
+# Serializes find_get_current_sources() on shared finders. The wrapper returns
+# Source objects that point into the finder's own array, which the next call
+# replaces, so the list must be consumed before another thread queries. The
+# blocking find_wait_for_sources() is called outside any lock.
+_finder_query_lock = threading.Lock()
+# Cache of discovered sources {source_name: ndi.Source}. Copy-on-write: writers hold
+# _cache_lock and rebind a new dict, so readers need no lock.
+_cache_lock = threading.Lock()
+_source_cache: dict = {}
+# Per-camera finders by source name. Finders are never destroyed (see cleanup_ndi), so a
+# stream restart reuses its camera's finder instead of leaking a new native instance.
+_camera_finders: dict[str, Any] = {}
+# time.monotonic() of the last wait on the global finder (its source list is fresh)
+_last_discovery_time = -math.inf
 _preferred_network_interface: str | None = None  # Preferred network interface IP for NDI binding
 _stream_metrics_lock = threading.Lock()
 _stream_metrics = {
@@ -38,12 +54,38 @@ _stream_metrics = {
     "stops": 0,
 }
 
+# Emitted-but-unreleased frames at which a pooled stream stops converting (the newest
+# frame held by the UI plus one still queued to it)
+_MAX_FRAMES_IN_FLIGHT = 2
+
+# Captured video frames waiting for the conversion worker; reception drops new frames
+# (freeing them at once) while it is full rather than blocking on conversion
+_CONVERT_QUEUE_SIZE = 2
+
+# Extra frames pulled with a zero-timeout capture once a video frame is picked for display,
+# so a burst is collapsed to its newest video frame in one pass instead of one loop
+# iteration per frame
+_MAX_DRAIN_FRAMES = 4
+
+# Resolutions whose UYVY conversion buffers each NDIVideoThread keeps around
+_UYVY_BUFFER_POOL_SIZE = 3
+# Numba UYVY->RGB kernel, resolved on the first UYVY frame (False if unavailable).
+# Resolving compiles or loads the kernel, so it stays off the import path.
+_uyvy_kernel: Any = None
+
 _ndi_forced_disabled = os.getenv("VIDEOCUE_DISABLE_NDI", "0") == "1"
 
 
-def _stream_metrics_snapshot() -> dict[str, int]:
+def _stream_metrics_snapshot() -> tuple[int, int, int, int, int]:
+    """(active, connected, failed, starts, stops) read under one lock hold"""
     with _stream_metrics_lock:
-        return dict(_stream_metrics)
+        return (
+            _stream_metrics["active_streams"],
+            _stream_metrics["connected_streams"],
+            _stream_metrics["failed_streams"],
+            _stream_metrics["starts"],
+            _stream_metrics["stops"],
+        )
 
 
 def _stream_metrics_on_start() -> None:
@@ -70,62 +112,211 @@ def _stream_metrics_on_stop(was_connected: bool) -> None:
             _stream_metrics["connected_streams"] = max(0, _stream_metrics["connected_streams"] - 1)
 
 
-def _get_process_rss_mb() -> float | None:
-    try:
-        import psutil
+def _statm_rss_reader():
+    """Linux: resident pages from /proc/self/statm (one small read, no parsing of status)."""
+    page_size = os.sysconf("SC_PAGE_SIZE")
 
-        return psutil.Process().memory_info().rss / (1024 * 1024)
-    except Exception:
-        pass
+    def read() -> int:
+        with open("/proc/self/statm", "rb") as statm:  # noqa: PTH123
+            return int(statm.read().split()[1]) * page_size
 
-    try:
-        import ctypes
-        from ctypes import wintypes
-
-        class PROCESS_MEMORY_COUNTERS_EX(ctypes.Structure):  # noqa: N801
-            _fields_ = [
-                ("cb", wintypes.DWORD),
-                ("PageFaultCount", wintypes.DWORD),
-                ("PeakWorkingSetSize", ctypes.c_size_t),
-                ("WorkingSetSize", ctypes.c_size_t),
-                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
-                ("QuotaPagedPoolUsage", ctypes.c_size_t),
-                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
-                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
-                ("PagefileUsage", ctypes.c_size_t),
-                ("PeakPagefileUsage", ctypes.c_size_t),
-                ("PrivateUsage", ctypes.c_size_t),
-            ]
+    read()  # raises OSError where /proc is not available
+    return read
 
-        psapi = ctypes.WinDLL("psapi", use_last_error=True)
-        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
 
-        get_current_process = kernel32.GetCurrentProcess
-        get_current_process.restype = wintypes.HANDLE
+def _psutil_rss_reader():
+    import psutil
 
-        get_process_memory_info = psapi.GetProcessMemoryInfo
-        get_process_memory_info.argtypes = [
-            wintypes.HANDLE,
-            ctypes.POINTER(PROCESS_MEMORY_COUNTERS_EX),
-            wintypes.DWORD,
+    memory_info = psutil.Process().memory_info
+
+    def read() -> int:
+        return memory_info().rss
+
+    return read
+
+
+def _windows_rss_reader():
+    """Windows without psutil: GetProcessMemoryInfo with the function and buffer set up once."""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS_EX(ctypes.Structure):  # noqa: N801
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+            ("PrivateUsage", ctypes.c_size_t),
         ]
-        get_process_memory_info.restype = wintypes.BOOL
 
-        counters = PROCESS_MEMORY_COUNTERS_EX()
-        counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS_EX)
-        handle = get_current_process()
-        ok = get_process_memory_info(handle, ctypes.byref(counters), counters.cb)
-        if not ok:
+    psapi = ctypes.WinDLL("psapi")
+    kernel32 = ctypes.WinDLL("kernel32")
+
+    get_current_process = kernel32.GetCurrentProcess
+    get_current_process.restype = wintypes.HANDLE
+
+    get_process_memory_info = psapi.GetProcessMemoryInfo
+    get_process_memory_info.argtypes = [
+        wintypes.HANDLE,
+        ctypes.POINTER(PROCESS_MEMORY_COUNTERS_EX),
+        wintypes.DWORD,
+    ]
+    get_process_memory_info.restype = wintypes.BOOL
+
+    counters = PROCESS_MEMORY_COUNTERS_EX()
+    counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS_EX)
+    counters_ref = ctypes.byref(counters)
+    # GetCurrentProcess returns a constant pseudo-handle, so it can be kept
+    handle = get_current_process()
+
+    def read() -> int | None:
+        if not get_process_memory_info(handle, counters_ref, counters.cb):
             return None
-        return counters.WorkingSetSize / (1024 * 1024)
+        return counters.WorkingSetSize
+
+    return read
+
+
+_rss_reader: Any = None  # RSS-in-bytes callable, resolved on first use (False if none)
+
+
+def _get_uyvy_kernel():
+    global _uyvy_kernel
+    if _uyvy_kernel is None:
+        try:
+            from videocue.ndi_wrapper._uyvy_numba import uyvy_to_rgb_into
+
+            _uyvy_kernel = uyvy_to_rgb_into or False
+        except Exception as e:
+            logger.warning(f"Numba UYVY kernel unavailable, using NumPy conversion: {e}")
+            _uyvy_kernel = False
+        if _uyvy_kernel:
+            logger.info("Using Numba UYVY->RGB kernel")
+    return _uyvy_kernel
+
+
+def _get_process_rss_mb() -> float | None:
+    global _rss_reader
+    if _rss_reader is None:
+        _rss_reader = False
+        for factory in (_statm_rss_reader, _psutil_rss_reader, _windows_rss_reader):
+            try:
+                _rss_reader = factory()
+                break
+            except Exception:
+                continue
+    if not _rss_reader:
+        return None
+
+    try:
+        rss = _rss_reader()
     except Exception:
         return None
+    return None if rss is None else rss / (1024 * 1024)
+
+
+class _FrameBufferPool:
+    """Bounded set of reusable frame buffers handed out as QImages.
+
+    A buffer is leased when its QImage is emitted and goes back on the free list
+    when the consumer passes that image to release(). Leases are keyed by
+    QImage.cacheKey(), which is shared by the implicit copies Qt makes when the
+    image crosses a signal. acquire() returns None when every buffer is leased so
+    the caller can fall back to an owned copy.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._lock = threading.Lock()
+        self._free: list[bytearray] = []
+        self._leased: dict[int, bytearray] = {}
+        self._allocated = 0
+        self._nbytes = 0
+
+    def acquire(self, frame_array, width: int, height: int, image_format) -> QImage | None:
+        """Copy a (height, width, 4) uint8 frame into a pooled buffer and wrap it."""
+        import numpy as np
+
+        nbytes = width * height * 4
+        with self._lock:
+            if nbytes != self._nbytes:
+                # Resolution changed: drop idle buffers, leased ones are discarded on release
+                self._free.clear()
+                self._allocated = len(self._leased)
+                self._nbytes = nbytes
+            if self._free:
+                buffer = self._free.pop()
+            elif self._allocated < self.size:
+                buffer = bytearray(nbytes)
+                self._allocated += 1
+            else:
+                return None
+
+        np.copyto(np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 4), frame_array)
+        qimage = QImage(buffer, width, height, width * 4, image_format)
+        with self._lock:
+            self._leased[qimage.cacheKey()] = buffer
+        return qimage
+
+    def release(self, qimage: QImage) -> None:
+        """Return the buffer behind a previously acquired image to the pool."""
+        with self._lock:
+            buffer = self._leased.pop(qimage.cacheKey(), None)
+            if buffer is None:
+                return
+            if len(buffer) == self._nbytes:
+                self._free.append(buffer)
+            else:
+                self._allocated -= 1
+
+
+# ndi.debug_get_counters() keys logged by the memory probe, in log order
+_WRAPPER_COUNTER_KEYS = (
+    "recv_instances_outstanding",
+    "find_instances_outstanding",
+    "recv_capture_v3_calls",
+    "recv_video_frames_captured",
+    "recv_free_video_calls",
+    "recv_free_audio_v3_calls",
+    "recv_free_metadata_calls",
+)
+
+
+# Shared (monotonic time, counters) from ndi.debug_get_counters(). Every stream's probe
+# ticks on the same interval, so one fetch per window serves all of them; a race
+# between probes only costs an extra fetch, never a torn value.
+_WRAPPER_COUNTERS_MAX_AGE_S = 0.5
+_wrapper_counters_cache: tuple[float, dict] | None = None
+
+
+def _wrapper_counters_snapshot() -> dict:
+    global _wrapper_counters_cache
+    now = time.monotonic()
+    cached = _wrapper_counters_cache
+    if cached is None or now - cached[0] > _WRAPPER_COUNTERS_MAX_AGE_S:
+        cached = (now, ndi.debug_get_counters())
+        _wrapper_counters_cache = cached
+    return cached[1]
 
 
 class _NDIMemoryProbe:
     def __init__(self, source_name: str):
         self.source_name = source_name
         self.enabled = os.getenv("VIDEOCUE_NDI_MEM_DEBUG", "0") == "1"
+        # tracemalloc hooks every allocation in the process, so it is opt-in on top of
+        # the RSS sampling that VIDEOCUE_NDI_MEM_DEBUG enables.
+        self.tracemalloc_enabled = (
+            self.enabled and os.getenv("VIDEOCUE_NDI_MEM_TRACEMALLOC", "0") == "1"
+        )
+        # A full collection at stream stop stalls every thread for a whole heap walk,
+        # so measuring what it reclaims is opt-in.
+        self.force_gc = self.enabled and os.getenv("VIDEOCUE_NDI_MEM_FORCE_GC", "0") == "1"
         self.interval_s = max(1, int(os.getenv("VIDEOCUE_NDI_MEM_INTERVAL_S", "10")))
         self.snapshot_interval_s = max(
             5, int(os.getenv("VIDEOCUE_NDI_MEM_SNAPSHOT_INTERVAL_S", "30"))
@@ -134,8 +325,9 @@ class _NDIMemoryProbe:
         self.wrapper_imbalance_warn_threshold = max(
             1, int(os.getenv("VIDEOCUE_NDI_WRAPPER_IMBALANCE_WARN", "500"))
         )
-        self._last_log_at = 0.0
-        self._last_snapshot_at = 0.0
+        # Monotonic timestamps; -inf makes the first tick log (and snapshot) immediately
+        self._last_log_at = -math.inf
+        self._last_snapshot_at = -math.inf
         self._baseline_rss = None
         self._last_rss = None
         self._last_snapshot = None
@@ -144,150 +336,122 @@ class _NDIMemoryProbe:
         if not self.enabled:
             return
 
-        try:
-            import tracemalloc
-
-            if not tracemalloc.is_tracing():
-                tracemalloc.start(25)
-            self._last_snapshot = tracemalloc.take_snapshot()
-            self._last_snapshot_at = 0.0
-        except Exception as e:
-            logger.warning(f"[NDI MEM][{self.source_name}] tracemalloc init failed: {e}")
-            self.enabled = False
-            return
+        if self.tracemalloc_enabled:
+            try:
+                if not tracemalloc.is_tracing():
+                    # One frame is enough for the "lineno" snapshot comparison
+                    tracemalloc.start(1)
+                self._last_snapshot = tracemalloc.take_snapshot()
+            except Exception as e:
+                logger.warning(f"[NDI MEM][{self.source_name}] tracemalloc init failed: {e}")
+                self.tracemalloc_enabled = False
 
         self._baseline_rss = _get_process_rss_mb()
         self._last_rss = self._baseline_rss
-        logger.info(
-            f"[NDI MEM][{self.source_name}] enabled interval={self.interval_s}s "
-            f"snapshot_interval={self.snapshot_interval_s}s top_n={self.top_n} "
-            f"rss_baseline_mb={self._baseline_rss:.1f}"
-            if self._baseline_rss is not None
-            else f"[NDI MEM][{self.source_name}] enabled interval={self.interval_s}s "
-            f"snapshot_interval={self.snapshot_interval_s}s top_n={self.top_n}"
-        )
+        fmt = "[NDI MEM][%s] enabled interval=%ds tracemalloc=%s snapshot_interval=%ds top_n=%d"
+        args: list[Any] = [
+            self.source_name,
+            self.interval_s,
+            self.tracemalloc_enabled,
+            self.snapshot_interval_s,
+            self.top_n,
+        ]
+        if self._baseline_rss is not None:
+            fmt += " rss_baseline_mb=%.1f"
+            args.append(self._baseline_rss)
+        logger.info(fmt, *args)
 
     def tick(self, frame_count: int) -> None:
-        if not self.enabled:
+        # Everything the probe reports is INFO (the imbalance warning rides along with it)
+        if not self.enabled or not logger.isEnabledFor(logging.INFO):
             return
 
-        import gc
-        import time
-        import tracemalloc
-
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_log_at < self.interval_s:
             return
         self._last_log_at = now
 
+        # Format string and arguments are assembled together so logging formats once
+        fmt = "[NDI MEM][%s] frames=%d"
+        args: list[Any] = [self.source_name, frame_count]
+
         rss_mb = _get_process_rss_mb()
-        current, peak = tracemalloc.get_traced_memory()
-        py_current_mb = current / (1024 * 1024)
-        py_peak_mb = peak / (1024 * 1024)
-
-        delta_rss = 0.0
-        if rss_mb is not None and self._last_rss is not None:
-            delta_rss = rss_mb - self._last_rss
-        baseline_delta = 0.0
-        if rss_mb is not None and self._baseline_rss is not None:
-            baseline_delta = rss_mb - self._baseline_rss
-
-        gc_counts = gc.get_count()
-
-        wrapper_suffix = ""
-        wrapper_total_video_imbalance = None
-        wrapper_interval_video_imbalance = None
-        try:
-            if hasattr(ndi, "debug_get_counters"):
-                counters = ndi.debug_get_counters()
-                recv_outstanding = int(counters.get("recv_instances_outstanding", 0))
-                find_outstanding = int(counters.get("find_instances_outstanding", 0))
-                capture_v3_calls = int(counters.get("recv_capture_v3_calls", 0))
-                video_captured = int(counters.get("recv_video_frames_captured", 0))
-                free_video_calls = int(counters.get("recv_free_video_calls", 0))
-                free_audio_v3_calls = int(counters.get("recv_free_audio_v3_calls", 0))
-                free_metadata_calls = int(counters.get("recv_free_metadata_calls", 0))
-
-                delta_capture = 0
-                delta_video_captured = 0
-                delta_free_video = 0
-                if self._last_wrapper_counters is not None:
-                    delta_capture = capture_v3_calls - int(
-                        self._last_wrapper_counters.get("recv_capture_v3_calls", 0)
-                    )
-                    delta_video_captured = video_captured - int(
-                        self._last_wrapper_counters.get("recv_video_frames_captured", 0)
-                    )
-                    delta_free_video = free_video_calls - int(
-                        self._last_wrapper_counters.get("recv_free_video_calls", 0)
-                    )
+        if rss_mb is not None:
+            delta_rss = rss_mb - self._last_rss if self._last_rss is not None else 0.0
+            baseline_delta = rss_mb - self._baseline_rss if self._baseline_rss is not None else 0.0
+            fmt += " rss_mb=%.1f delta_mb=%+.1f total_delta_mb=%+.1f"
+            args += (rss_mb, delta_rss, baseline_delta)
+            self._last_rss = rss_mb
+        else:
+            fmt += " rss_mb=NA"
 
-                self._last_wrapper_counters = counters
-                wrapper_total_video_imbalance = video_captured - free_video_calls
-                wrapper_interval_video_imbalance = delta_video_captured - delta_free_video
-                wrapper_suffix = (
-                    f" wrapper(recv_out={recv_outstanding} find_out={find_outstanding} "
-                    f"cap_v3={capture_v3_calls} cap_vid={video_captured} free_v={free_video_calls} free_a3={free_audio_v3_calls} "
-                    f"free_m={free_metadata_calls} d_cap={delta_capture:+d} d_cap_vid={delta_video_captured:+d} "
-                    f"d_free_v={delta_free_video:+d} vid_imb={wrapper_total_video_imbalance:+d} "
-                    f"d_vid_imb={wrapper_interval_video_imbalance:+d})"
-                )
-        except Exception:
-            wrapper_suffix = " wrapper(debug_counters=error)"
+        if self.tracemalloc_enabled:
+            current, peak = tracemalloc.get_traced_memory()
+            fmt += " py_mb=%.1f py_peak_mb=%.1f"
+            args += (current / (1024 * 1024), peak / (1024 * 1024))
 
-        if (
-            wrapper_total_video_imbalance is not None
-            and wrapper_interval_video_imbalance is not None
-            and abs(wrapper_total_video_imbalance) >= self.wrapper_imbalance_warn_threshold
-        ):
-            logger.warning(
-                "[NDI MEM][%s] wrapper imbalance warning total_video_imbalance=%+d interval_video_imbalance=%+d threshold=%d",
-                self.source_name,
-                wrapper_total_video_imbalance,
-                wrapper_interval_video_imbalance,
-                self.wrapper_imbalance_warn_threshold,
-            )
+        fmt += " gc=%s streams(active=%d connected=%d failed=%d starts=%d stops=%d)"
+        args.append(gc.get_count())
+        args += _stream_metrics_snapshot()
 
-        stream_metrics = _stream_metrics_snapshot()
+        if hasattr(ndi, "debug_get_counters"):
+            try:
+                counters = _wrapper_counters_snapshot()
+                values = tuple(counters.get(key, 0) for key in _WRAPPER_COUNTER_KEYS)
+            except Exception:
+                values = None
 
-        if rss_mb is not None:
-            logger.info(
-                "[NDI MEM][%s] frames=%d rss_mb=%.1f delta_mb=%+.1f total_delta_mb=%+.1f "
-                "py_mb=%.1f py_peak_mb=%.1f gc=%s streams(active=%d connected=%d failed=%d starts=%d stops=%d)%s",
-                self.source_name,
-                frame_count,
-                rss_mb,
-                delta_rss,
-                baseline_delta,
-                py_current_mb,
-                py_peak_mb,
-                gc_counts,
-                stream_metrics["active_streams"],
-                stream_metrics["connected_streams"],
-                stream_metrics["failed_streams"],
-                stream_metrics["starts"],
-                stream_metrics["stops"],
-                wrapper_suffix,
-            )
-            self._last_rss = rss_mb
-        else:
-            logger.info(
-                "[NDI MEM][%s] frames=%d rss_mb=NA py_mb=%.1f py_peak_mb=%.1f gc=%s "
-                "streams(active=%d connected=%d failed=%d starts=%d stops=%d)%s",
-                self.source_name,
-                frame_count,
-                py_current_mb,
-                py_peak_mb,
-                gc_counts,
-                stream_metrics["active_streams"],
-                stream_metrics["connected_streams"],
-                stream_metrics["failed_streams"],
-                stream_metrics["starts"],
-                stream_metrics["stops"],
-                wrapper_suffix,
-            )
+            if values is None:
+                fmt += " wrapper(debug_counters=error)"
+            else:
+                (
+                    recv_outstanding,
+                    find_outstanding,
+                    capture_v3_calls,
+                    video_captured,
+                    free_video_calls,
+                    free_audio_v3_calls,
+                    free_metadata_calls,
+                ) = values
+                last = self._last_wrapper_counters or values
+                delta_capture = capture_v3_calls - last[2]
+                delta_video_captured = video_captured - last[3]
+                delta_free_video = free_video_calls - last[4]
+                self._last_wrapper_counters = values
+
+                total_video_imbalance = video_captured - free_video_calls
+                interval_video_imbalance = delta_video_captured - delta_free_video
+                fmt += (
+                    " wrapper(recv_out=%d find_out=%d cap_v3=%d cap_vid=%d free_v=%d free_a3=%d"
+                    " free_m=%d d_cap=%+d d_cap_vid=%+d d_free_v=%+d vid_imb=%+d d_vid_imb=%+d)"
+                )
+                args += (
+                    recv_outstanding,
+                    find_outstanding,
+                    capture_v3_calls,
+                    video_captured,
+                    free_video_calls,
+                    free_audio_v3_calls,
+                    free_metadata_calls,
+                    delta_capture,
+                    delta_video_captured,
+                    delta_free_video,
+                    total_video_imbalance,
+                    interval_video_imbalance,
+                )
+
+                if abs(total_video_imbalance) >= self.wrapper_imbalance_warn_threshold:
+                    logger.warning(
+                        "[NDI MEM][%s] wrapper imbalance warning total_video_imbalance=%+d interval_video_imbalance=%+d threshold=%d",
+                        self.source_name,
+                        total_video_imbalance,
+                        interval_video_imbalance,
+                        self.wrapper_imbalance_warn_threshold,
+                    )
 
-        if now - self._last_snapshot_at >= self.snapshot_interval_s:
+        logger.info(fmt, *args)
+
+        if self.tracemalloc_enabled and now - self._last_snapshot_at >= self.snapshot_interval_s:
             try:
                 snapshot = tracemalloc.take_snapshot()
                 if self._last_snapshot is not None:
@@ -303,9 +467,19 @@ class _NDIMemoryProbe:
         if not self.enabled:
             return
 
-        import gc
-
         before_gc = _get_process_rss_mb()
+        if not self.force_gc:
+            if before_gc is not None:
+                logger.info(
+                    "[NDI MEM][%s] finalize rss_mb=%.1f total_delta_mb=%+.1f",
+                    self.source_name,
+                    before_gc,
+                    before_gc - self._baseline_rss if self._baseline_rss is not None else 0.0,
+                )
+            else:
+                logger.info("[NDI MEM][%s] finalize completed", self.source_name)
+            return
+
         gc.collect()
         after_gc = _get_process_rss_mb()
 
@@ -359,6 +533,9 @@ def set_preferred_network_interface(interface_ip: str | None) -> None:
     global _preferred_network_interface
     # Thread-safe modification of global state
     with _ndi_lock:
+        if interface_ip != _preferred_network_interface:
+            # Per-camera finders carry the old binding; let the next connect make new ones
+            _camera_finders.clear()
         _preferred_network_interface = interface_ip
     if interface_ip:
         logger.info("[NDI Config] Preferred network interface set to: %s", interface_ip)
@@ -409,12 +586,74 @@ def _ensure_ndi_initialized() -> bool:
         return _ndi_initialized and _global_finder is not None
 
 
+def _source_name(source) -> str:
+    """Name of an ndi.Source (the wrapper decodes it on every attribute read)"""
+    name = source.ndi_name
+    return name.decode("utf-8") if isinstance(name, bytes) else str(name)
+
+
+def _index_sources(sources) -> dict[str, Any]:
+    """Map source names to sources, keeping the first source seen for each name"""
+    index: dict[str, Any] = {}
+    for source in sources:
+        index.setdefault(_source_name(source), source)
+    return index
+
+
+def _wait_for_global_sources(finder, timeout_ms: int) -> None:
+    """Block on the global finder for source changes and note when it was refreshed"""
+    global _last_discovery_time
+    ndi.find_wait_for_sources(finder, timeout_ms)
+    _last_discovery_time = time.monotonic()
+
+
+def _find_current_source(finder, source_name: str):
+    """Look up a source in the finder's current list (no network wait)"""
+    with _finder_query_lock:
+        return _index_sources(ndi.find_get_current_sources(finder)).get(source_name)
+
+
+def _get_camera_finder(source_name: str) -> tuple[Any, bool]:
+    """Return (finder, created) for a camera's dedicated finder, creating it on first use"""
+    with _ndi_lock:
+        finder = _camera_finders.get(source_name)
+        if finder is not None:
+            return finder, False
+
+        find_settings = ndi.FindCreate()
+        find_settings.show_local_sources = True
+
+        # Apply network interface binding if configured
+        if _preferred_network_interface:
+            find_settings.extra_ips = _preferred_network_interface
+            logger.info(
+                f"[{source_name}] Binding to network interface: {_preferred_network_interface}"
+            )
+
+        finder = ndi.find_create_v2(find_settings)
+        if finder:
+            _camera_finders[source_name] = finder
+        return finder, True
+
+
+def _cache_sources(sources: dict) -> None:
+    """Publish newly discovered sources"""
+    global _source_cache
+    with _cache_lock:
+        _source_cache = {**_source_cache, **sources}
+
+
 def clear_source_cache() -> None:
     """Clear the cached NDI sources (useful if sources change on network)"""
     global _source_cache
-    with _ndi_lock:
-        _source_cache.clear()
-        logger.info("[NDI] Source cache cleared")
+    with _cache_lock:
+        _source_cache = {}
+    logger.info("[NDI] Source cache cleared")
+
+
+def get_cached_source_names() -> list[str]:
+    """Names of every source cached by discovery so far (no network wait)"""
+    return list(_source_cache)
 
 
 def cleanup_ndi() -> None:
@@ -427,7 +666,10 @@ def cleanup_ndi() -> None:
     global _ndi_initialized, _global_finder, _source_cache
     with _ndi_lock:
         # Clear source cache
-        _source_cache.clear()
+        with _cache_lock:
+            _source_cache = {}
+
+        _camera_finders.clear()
 
         if _global_finder:
             # try:
@@ -487,6 +729,7 @@ class NDIVideoThread(QThread):
         vectorscope_enabled: bool = False,
         rgb_parade_enabled: bool = False,
         histogram_enabled: bool = False,
+        frame_pool_size: int = 0,
     ):
         super().__init__()
         self.setObjectName(f"NDIVideoThread-{source_name}")
@@ -510,12 +753,26 @@ class NDIVideoThread(QThread):
         self._metrics_connected = False
         self._metrics_failed = False
         self._memory_probe = _NDIMemoryProbe(source_name)
-        # Persistent buffers for UYVY conversion (reused across frames)
-        self._rgb_buffer = None
-        self._rgb_buffer_shape = None
-        # Persistent working buffers for UYVY math (avoid per-frame allocations)
-        self._uyvy_work_buffers = None  # (y0, y1, u, v, temp1, temp2) float32 arrays
-        self._uyvy_work_shape = None
+        # Optional pooled frame buffers (consumer must hand frames back via release_frame)
+        self._frame_pool = _FrameBufferPool(frame_pool_size) if frame_pool_size > 0 else None
+        # Frames emitted but not yet handed back, tracked only for pooled consumers (they
+        # release every frame); a backlog means the UI is behind, so conversion is skipped
+        self._frames_in_flight = 0
+        self._frames_in_flight_lock = threading.Lock()
+        # Reception hands captured video frames to a conversion worker thread, which converts,
+        # frees them and emits frame_ready, so capture never waits on conversion
+        self._convert_queue: queue.Queue = queue.Queue(maxsize=_CONVERT_QUEUE_SIZE)
+        self._convert_worker: threading.Thread | None = None
+        self._convert_stop = threading.Event()
+        # FourCC -> converter, built once NDI is loaded (see _build_fourcc_handlers)
+        self._fourcc_handlers: dict[Any, Any] = {}
+        # Payload -> bytes extractor, chosen from the first frame's data type (it does not
+        # change within a stream)
+        self._extract_bytes = None
+        # Persistent UYVY conversion buffers (RGB output + float32 working arrays), keyed by
+        # (height, width). The most recent few resolutions are kept so a source that
+        # switches format mid-stream does not reallocate on every switch.
+        self._uyvy_buffer_pool: OrderedDict[tuple[int, int], tuple[Any, dict]] = OrderedDict()
         self._false_color_thresholds = None
         self._false_color_palette = None
         self._false_color_luma_buffer = None
@@ -553,6 +810,11 @@ class NDIVideoThread(QThread):
                 self.error.emit(err_msg)
                 return
 
+            self._build_fourcc_handlers()
+            if self.color_format == "uyvy":
+                # Compile/load the Numba kernel here, off the first frame's latency
+                _get_uyvy_kernel()
+
             self._run_reception_loop()
         except NDINotAvailableError as e:
             logger.error(f"[NDI] NDI not available: {e}")
@@ -574,8 +836,6 @@ class NDIVideoThread(QThread):
 
     def _run_reception_loop(self):
         """Internal reception loop (called by run() with error handling)"""
-        import gc
-        import time
 
         def _build_manual_source():
             source = ndi.Source()
@@ -637,9 +897,7 @@ class NDIVideoThread(QThread):
             # Cached ndi.Source instances can become stale across thread/native lifetimes.
             # Use cache only as a hint, then resolve a fresh source handle via finder.
             try:
-                with _ndi_lock:
-                    cache_hit = self.source_name in _source_cache
-                if cache_hit:
+                if self.source_name in _source_cache:
                     logger.info(
                         f"[{self.source_name}] Cache hint present; resolving fresh source via global finder"
                     )
@@ -649,24 +907,23 @@ class NDIVideoThread(QThread):
             # METHOD 2: Refresh global finder and match source by name
             try:
                 logger.info(f"[{self.source_name}] Querying global finder for source...")
-                with _ndi_lock:
-                    ndi.find_wait_for_sources(
-                        _global_finder, NetworkConstants.NDI_DISCOVERY_QUICK_TIMEOUT_MS
+                finder = _global_finder
+                source = None
+                # Streams starting together (or right after startup discovery) share the
+                # finder's fresh list instead of each blocking on their own wait
+                since_refresh_ms = (time.monotonic() - _last_discovery_time) * 1000
+                if since_refresh_ms < NetworkConstants.NDI_DISCOVERY_COALESCE_MS:
+                    source = _find_current_source(finder, self.source_name)
+                if source is None:
+                    _wait_for_global_sources(
+                        finder, NetworkConstants.NDI_DISCOVERY_QUICK_TIMEOUT_MS
                     )
-                    sources = ndi.find_get_current_sources(_global_finder)
-
-                    for source in sources:
-                        source_name = (
-                            source.ndi_name.decode("utf-8")
-                            if isinstance(source.ndi_name, bytes)
-                            else str(source.ndi_name)
-                        )
-                        if source_name == self.source_name:
-                            target_source = source
-                            _source_cache[self.source_name] = source
-                            source_creation_method = "global-finder"
-                            logger.info(f"[{self.source_name}] ✓ Matched source via global finder")
-                            break
+                    source = _find_current_source(finder, self.source_name)
+                if source is not None:
+                    target_source = source
+                    _cache_sources({self.source_name: source})
+                    source_creation_method = "global-finder"
+                    logger.info(f"[{self.source_name}] ✓ Matched source via global finder")
             except Exception as e:
                 logger.warning(f"[{self.source_name}] Global finder lookup failed: {e}")
 
@@ -676,50 +933,47 @@ class NDIVideoThread(QThread):
                     f"[{self.source_name}] Source not in cache/global finder, trying per-camera finder..."
                 )
                 try:
-                    # Create dedicated finder for this camera
-                    logger.info(f"[{self.source_name}] Creating dedicated NDI finder...")
+                    # Dedicated finder for this camera, kept from any earlier connect attempt
                     finder_start = time.time()
-                    find_settings = ndi.FindCreate()
-                    find_settings.show_local_sources = True
-
-                    # Apply network interface binding if configured
-                    if _preferred_network_interface:
-                        find_settings.extra_ips = _preferred_network_interface
+                    self._finder, created = _get_camera_finder(self.source_name)
+                    finder_elapsed = (time.time() - finder_start) * 1000
+                    if created:
+                        self._finder_created_at = time.time()
                         logger.info(
-                            f"[{self.source_name}] Binding to network interface: {_preferred_network_interface}"
+                            f"[{self.source_name}] ✓ Finder created in {finder_elapsed:.1f}ms"
                         )
+                    else:
+                        logger.info(f"[{self.source_name}] Reusing dedicated NDI finder")
 
-                    self._finder = ndi.find_create_v2(find_settings)
-                    self._finder_created_at = time.time()
-                    finder_elapsed = (time.time() - finder_start) * 1000
-                    logger.info(f"[{self.source_name}] ✓ Finder created in {finder_elapsed:.1f}ms")
-
-                    # Quick discovery with per-camera finder
-                    logger.info(
-                        f"[{self.source_name}] Discovering sources (quick: 1500ms timeout)..."
-                    )
                     discover_start = time.time()
-                    ndi.find_wait_for_sources(
-                        self._finder, NetworkConstants.NDI_DISCOVERY_QUICK_TIMEOUT_MS
-                    )
-                    sources = ndi.find_get_current_sources(self._finder)
+                    sources = {}
+                    if not created:
+                        # A reused finder has kept tracking the network; only wait on a miss
+                        with _finder_query_lock:
+                            sources = _index_sources(ndi.find_get_current_sources(self._finder))
+                    if self.source_name not in sources:
+                        # Quick discovery with per-camera finder
+                        logger.info(
+                            f"[{self.source_name}] Discovering sources (quick: 1500ms timeout)..."
+                        )
+                        ndi.find_wait_for_sources(
+                            self._finder, NetworkConstants.NDI_DISCOVERY_QUICK_TIMEOUT_MS
+                        )
+                        with _finder_query_lock:
+                            sources = _index_sources(ndi.find_get_current_sources(self._finder))
                     discover_elapsed = (time.time() - discover_start) * 1000
                     logger.info(
                         f"[{self.source_name}] Found {len(sources)} sources in {discover_elapsed:.1f}ms"
                     )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for source_name in sources:
+                            logger.debug(f"[{self.source_name}]   - Discovered: {source_name}")
 
-                    for source in sources:
-                        source_name = (
-                            source.ndi_name.decode("utf-8")
-                            if isinstance(source.ndi_name, bytes)
-                            else str(source.ndi_name)
-                        )
-                        logger.debug(f"[{self.source_name}]   - Discovered: {source_name}")
-                        if source_name == self.source_name:
-                            target_source = source
-                            logger.info(f"[{self.source_name}] ✓ Matched source via discovery")
-                            source_creation_method = "per-camera-finder"
-                            break
+                    source = sources.get(self.source_name)
+                    if source is not None:
+                        target_source = source
+                        logger.info(f"[{self.source_name}] ✓ Matched source via discovery")
+                        source_creation_method = "per-camera-finder"
 
                 except Exception as e:
                     logger.error(f"[{self.source_name}] ✗ Per-camera finder failed: {e}")
@@ -784,6 +1038,8 @@ class NDIVideoThread(QThread):
                 f"[{self.source_name}] ✓ recv_connect() returned in {connect_elapsed:.1f}ms"
             )
 
+            self._start_conversion_worker(self._receiver)
+
             # Reception loop
             self.running = True
             first_frame = True
@@ -796,7 +1052,9 @@ class NDIVideoThread(QThread):
             recovery_threshold = max(20, max_no_frame_attempts // 3)
             current_resolution = None  # Track resolution to detect changes
             first_frame_time = None
-            attempted_manual_reconnect = False
+            # Manual reconnects are spaced by capped exponential backoff (1 s, 2 s, 4 s, ...)
+            reconnect_attempts = 0
+            next_reconnect_at = 0.0
 
             total_elapsed = (time.time() - start_time) * 1000
             logger.info(
@@ -812,13 +1070,19 @@ class NDIVideoThread(QThread):
                     try:
                         # SDK RECOMMENDATION: Use recv_capture_v3 to match recv_create_v3
                         # v3 is thread-safe and provides better audio frame handling
-                        # Use 100ms timeout (SDK: reasonable timeout better than zero-timeout polling)
-                        t, v, _a, _m = ndi.recv_capture_v3(self._receiver, 100)
+                        # Use 100ms timeout (SDK: reasonable timeout better than zero-timeout polling).
+                        # Capture returns as soon as any frame arrives, so the timeout only bounds
+                        # idle polls; the no-frame thresholds count polls of this length.
+                        t, v, _a, _m = ndi.recv_capture_v3(
+                            self._receiver, NetworkConstants.NDI_FRAME_TIMEOUT_MS
+                        )
 
                         if t == ndi.FRAME_TYPE_VIDEO:
                             frame_count += 1
                             self._memory_probe.tick(frame_count)
                             no_frame_count = 0  # Reset timeout counter on successful frame
+                            reconnect_attempts = 0
+                            next_reconnect_at = 0.0
 
                             # Extract web control URL on first frame
                             if first_frame:
@@ -840,6 +1104,26 @@ class NDIVideoThread(QThread):
                                     self.connected.emit(web_url)
                                 first_frame = False
 
+                            # Skip frames based on preference (higher skip = lower quality/CPU
+                            # but faster). Skipped frames are freed before anything else reads
+                            # them, so their pixel buffers are never touched.
+                            skip_count += 1
+                            if skip_count % (self.frame_skip + 1) != 0:
+                                ndi.recv_free_video_v2(self._receiver, v)
+                                continue
+                            if self._frames_in_flight >= _MAX_FRAMES_IN_FLIGHT:
+                                # UI still has undelivered frames queued: don't convert one it
+                                # would only replace, and try again on the next frame
+                                skip_count -= 1
+                                ndi.recv_free_video_v2(self._receiver, v)
+                                continue
+                            # Reset skip counter to prevent overflow
+                            skip_count = 0
+
+                            # This frame will be displayed: swap in any newer one already queued
+                            v, superseded, drain_type = self._drain_to_latest_video(v)
+                            frame_count += superseded
+
                             # Emit resolution info if changed
                             resolution = (
                                 v.xres,
@@ -850,82 +1134,73 @@ class NDIVideoThread(QThread):
                                 self.resolution_changed.emit(v.xres, v.yres, resolution[2])
                                 current_resolution = resolution
 
-                            # Skip frames based on preference (higher skip = lower quality/CPU but faster)
-                            skip_count += 1
-                            if skip_count % (self.frame_skip + 1) == 0:
-                                # Convert frame to QImage
-                                qimage = self._convert_frame(v)
-                                if qimage:
-                                    # Emit signal - Qt will drop old frames if UI hasn't processed them
-                                    self.frame_ready.emit(qimage)
-
-                                    # Log every 100 processed frames to verify performance
-                                    if frame_count % 100 == 0:
-                                        logger.debug(
-                                            f"[NDI] {self.source_name}: Processed {frame_count} frames, displayed ~{frame_count // (self.frame_skip + 1)} (skip={self.frame_skip})"
-                                        )
-
-                                    # MEMORY OPTIMIZATION: frequent incremental GC to limit young-object buildup
-                                    # (conversion path creates many temporary arrays/bytes)
-                                    if frame_count % 30 == 0:
-                                        gc.collect(generation=0)
-
-                                    # Full GC more frequently to reduce long-run RSS drift
-                                    if frame_count % 300 == 0:
-                                        gc.collect()
-                                        logger.debug(
-                                            f"[NDI] {self.source_name}: Full GC at {frame_count} frames"
-                                        )
-
-                                # Explicitly delete QImage to help memory cleanup
-                                del qimage
+                            # Hand the frame to the conversion worker, which frees it
+                            try:
+                                self._convert_queue.put_nowait(v)
+                            except queue.Full:
+                                ndi.recv_free_video_v2(self._receiver, v)
 
-                                # Reset skip counter to prevent overflow
-                                skip_count = 0
+                            # Log every 100 processed frames to verify performance
+                            if frame_count % 100 == 0:
+                                logger.debug(
+                                    f"[NDI] {self.source_name}: Processed {frame_count} frames, displayed ~{frame_count // (self.frame_skip + 1)} (skip={self.frame_skip})"
+                                )
 
-                            # Free the video frame
-                            ndi.recv_free_video_v2(self._receiver, v)
+                            if drain_type == ndi.FRAME_TYPE_ERROR:
+                                # The drain consumed the error, so report it here
+                                logger.debug("Received error frame type")
+                                if not self._metrics_failed:
+                                    _stream_metrics_on_failed()
+                                    self._metrics_failed = True
+                                self.error.emit(f"NDI error receiving from '{self.source_name}'")
+                                break
 
                         elif t == ndi.FRAME_TYPE_AUDIO:
                             # CRITICAL: Audio frames MUST be freed to prevent memory leaks
-                            with contextlib.suppress(Exception):
+                            try:
                                 ndi.recv_free_audio_v3(self._receiver, _a)
+                            except Exception as e:
+                                logger.debug(f"[NDI] {self.source_name}: Audio free failed: {e}")
 
                         elif t == ndi.FRAME_TYPE_METADATA:
                             # CRITICAL: Metadata frames MUST be freed to prevent memory leaks
-                            with contextlib.suppress(Exception):
+                            try:
                                 ndi.recv_free_metadata(self._receiver, _m)
+                            except Exception as e:
+                                logger.debug(f"[NDI] {self.source_name}: Metadata free failed: {e}")
 
                         elif t == ndi.FRAME_TYPE_NONE:
                             # No data received, increment timeout counter
                             no_frame_count += 1
                             if no_frame_count >= recovery_threshold:
-                                # Recovery path: if initial source came from finder/cache and produced no frames,
-                                # retry connection once using manual source object by name.
-                                if (
-                                    not attempted_manual_reconnect
-                                    and source_creation_method != "manual"
-                                    and self._receiver
-                                ):
-                                    logger.warning(
-                                        f"[{self.source_name}] No frames via {source_creation_method}; retrying with manual source fallback"
-                                    )
-                                    try:
-                                        manual_source = _build_manual_source()
-                                        ndi.recv_connect(self._receiver, manual_source)
-                                        source_creation_method = "manual-reconnect"
-                                        attempted_manual_reconnect = True
-                                        no_frame_count = 0
-                                        first_frame = True
-                                        logger.info(
-                                            f"[{self.source_name}] Manual reconnect applied; waiting for frames again"
+                                # Recovery path: until the no-frame budget runs out, re-issue
+                                # recv_connect with a manual source object by name, backing off
+                                # between attempts so a short outage can be ridden out.
+                                if no_frame_count < max_no_frame_attempts and self._receiver:
+                                    now = time.monotonic()
+                                    if now >= next_reconnect_at:
+                                        reconnect_attempts += 1
+                                        next_reconnect_at = now + min(
+                                            NetworkConstants.NDI_RECONNECT_MAX_BACKOFF_S,
+                                            2.0 ** (reconnect_attempts - 1),
                                         )
-                                        continue
-                                    except Exception as reconnect_error:
-                                        logger.error(
-                                            f"[{self.source_name}] Manual reconnect failed: {reconnect_error}",
-                                            exc_info=True,
+                                        logger.warning(
+                                            f"[{self.source_name}] No frames via {source_creation_method}; retrying with manual source fallback (attempt {reconnect_attempts})"
                                         )
+                                        try:
+                                            manual_source = _build_manual_source()
+                                            ndi.recv_connect(self._receiver, manual_source)
+                                            source_creation_method = "manual-reconnect"
+                                            first_frame = True
+                                            logger.info(
+                                                f"[{self.source_name}] Manual reconnect applied; waiting for frames again"
+                                            )
+                                        except Exception as reconnect_error:
+                                            logger.error(
+                                                f"[{self.source_name}] Manual reconnect failed: {reconnect_error}",
+                                                exc_info=True,
+                                            )
+                                    continue
 
                                 # Avoid aggressive in-loop receiver recreation/probing because repeated
                                 # native create/destroy churn has shown instability in the field.
@@ -1014,6 +1289,133 @@ class NDIVideoThread(QThread):
         # Thread will stop asynchronously, caller should check isRunning() if needed
         return True
 
+    def _start_conversion_worker(self, receiver) -> None:
+        """Start the thread that converts queued frames and emits frame_ready
+
+        The worker frees frames through its own receiver reference, so it stays valid
+        even if _cleanup() drops self._receiver before the worker has exited.
+        """
+        self._convert_stop.clear()
+        self._convert_worker = threading.Thread(
+            target=self._conversion_worker,
+            args=(receiver,),
+            name=f"NDIConvert-{self.source_name}",
+            daemon=True,
+        )
+        self._convert_worker.start()
+
+    def _free_converted_frame(self, receiver, video_frame) -> None:
+        """Free a frame handed to the conversion worker, never raising"""
+        try:
+            ndi.recv_free_video_v2(receiver, video_frame)
+        except Exception as e:
+            logger.debug(f"[NDI] {self.source_name}: Video free failed: {e}")
+
+    def _conversion_worker(self, receiver) -> None:
+        """Convert queued video frames until stopped, then free whatever is still queued"""
+        poll_s = NetworkConstants.NDI_FRAME_TIMEOUT_MS / 1000
+        while not self._convert_stop.is_set():
+            try:
+                video_frame = self._convert_queue.get(timeout=poll_s)
+            except queue.Empty:
+                continue
+            try:
+                qimage = self._convert_frame(video_frame)
+            except Exception:
+                logger.exception(f"[NDI] {self.source_name}: Frame conversion failed")
+                qimage = None
+            finally:
+                self._free_converted_frame(receiver, video_frame)
+            if qimage:
+                if self._frame_pool is not None:
+                    with self._frames_in_flight_lock:
+                        self._frames_in_flight += 1
+                # Queued to the UI thread, which keeps only the newest frame
+                self.frame_ready.emit(qimage)
+            del qimage
+
+        while True:
+            try:
+                video_frame = self._convert_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._free_converted_frame(receiver, video_frame)
+
+    def _stop_conversion_worker(self) -> None:
+        """Stop the conversion worker; it frees any frames it did not get to on exit"""
+        worker = self._convert_worker
+        self._convert_worker = None
+        if worker is None:
+            return
+        self._convert_stop.set()
+        worker.join(NetworkConstants.NDI_THREAD_STOP_TIMEOUT_S)
+        if worker.is_alive():
+            # Still inside a conversion; it frees the remaining frames once that returns
+            logger.warning(f"[{self.source_name}] Conversion worker did not stop in time")
+
+    def _drain_to_latest_video(self, video_frame) -> tuple[Any, int, Any]:
+        """Pull already-queued frames without waiting and keep only the newest video frame
+
+        Superseded video frames, audio and metadata are freed here. Returns the newest video
+        frame, how many older video frames it replaced, and the frame type that ended the
+        drain (FRAME_TYPE_NONE when nothing more was queued) so the caller can act on an
+        error it consumed. Status changes carry no payload and need no handling.
+        """
+        superseded = 0
+        t = ndi.FRAME_TYPE_NONE
+        for _ in range(_MAX_DRAIN_FRAMES):
+            t, v, a, m = ndi.recv_capture_v3(self._receiver, 0)
+            if t == ndi.FRAME_TYPE_VIDEO:
+                ndi.recv_free_video_v2(self._receiver, video_frame)
+                video_frame = v
+                superseded += 1
+            elif t == ndi.FRAME_TYPE_AUDIO:
+                try:
+                    ndi.recv_free_audio_v3(self._receiver, a)
+                except Exception as e:
+                    logger.debug(f"[NDI] {self.source_name}: Audio free failed: {e}")
+            elif t == ndi.FRAME_TYPE_METADATA:
+                try:
+                    ndi.recv_free_metadata(self._receiver, m)
+                except Exception as e:
+                    logger.debug(f"[NDI] {self.source_name}: Metadata free failed: {e}")
+            else:
+                break
+        return video_frame, superseded, t
+
+    def release_frame(self, qimage: QImage) -> None:
+        """Hand a frame_ready image back to the buffer pool once it has been consumed"""
+        if self._frame_pool is not None:
+            with self._frames_in_flight_lock:
+                self._frames_in_flight = max(0, self._frames_in_flight - 1)
+            self._frame_pool.release(qimage)
+
+    def _copy_frame_direct(self, video_frame, width: int, height: int, image_format):
+        """Copy a 4-byte-per-pixel frame straight out of NDI memory, or None to use the bytes path
+
+        Uses a pooled buffer when a pool is configured and has one free, otherwise a single
+        owned QImage copy (the bytes path copies twice: tobytes() then QImage.copy()).
+        """
+        if (
+            self.false_color_enabled
+            or self.waveform_enabled
+            or self.vectorscope_enabled
+            or self.rgb_parade_enabled
+            or self.histogram_enabled
+        ):
+            return None
+        data = video_frame.data
+        if getattr(data, "shape", None) != (height, width, 4):
+            return None
+        if self._frame_pool is not None:
+            pooled = self._frame_pool.acquire(data, width, height, image_format)
+            if pooled is not None:
+                return pooled
+        if not data.flags.c_contiguous:
+            return None
+        # The view aliases the NDI frame, which is freed only after this returns
+        return QImage(data.data, width, height, width * 4, image_format).copy()
+
     def _extract_web_control(self) -> str | None:
         """Extract web control URL from NDI receiver metadata"""
         if not self._receiver:
@@ -1040,416 +1442,14 @@ class NDIVideoThread(QThread):
     def _convert_frame(self, video_frame) -> QImage | None:
         """Convert NDI video frame to QImage with minimal allocations"""
         try:
-            # Get frame data
-            width = video_frame.xres
-            height = video_frame.yres
-            line_stride = video_frame.line_stride_in_bytes
-
-            # Native BGRA path - matches Qt's ARGB32 on little-endian Windows
-            if video_frame.FourCC == ndi.FOURCC_VIDEO_TYPE_BGRA:
-                # Get frame data as bytes - handle different data types
-                if hasattr(video_frame.data, "tobytes"):
-                    frame_data = video_frame.data.tobytes()
-                elif hasattr(video_frame.data, "__array__"):
-                    import numpy as np
-
-                    frame_data = bytes(np.array(video_frame.data).flatten())
-                else:
-                    frame_data = bytes(video_frame.data)
-
-                expected_size = line_stride * height
-                if len(frame_data) < expected_size:
-                    logger.debug(f"Frame data too small: {len(frame_data)} < {expected_size}")
-                    return None
-
-                if self.waveform_enabled:
-                    waveform_data = self._waveform_from_rgbx(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                        is_bgra=True,
-                    )
-                    if not waveform_data:
-                        logger.debug("Waveform conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        waveform_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_waveform_image(qimage)
-                    result = qimage.copy()
-                    del waveform_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.vectorscope_enabled:
-                    vectorscope_data = self._vectorscope_from_rgbx(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                        is_bgra=True,
-                    )
-                    if not vectorscope_data:
-                        logger.debug("Vectorscope conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        vectorscope_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_vectorscope_image(qimage)
-                    result = qimage.copy()
-                    del vectorscope_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.rgb_parade_enabled:
-                    rgb_parade_data = self._rgb_parade_from_rgbx(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                        is_bgra=True,
-                    )
-                    if not rgb_parade_data:
-                        logger.debug("RGB parade conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        rgb_parade_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_rgb_parade_image(qimage)
-                    result = qimage.copy()
-                    del rgb_parade_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.histogram_enabled:
-                    histogram_data = self._histogram_from_rgbx(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                        is_bgra=True,
-                    )
-                    if not histogram_data:
-                        logger.debug("Histogram conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        histogram_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_histogram_image(qimage)
-                    result = qimage.copy()
-                    del histogram_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.false_color_enabled:
-                    false_color_data = self._false_color_from_rgbx(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                        is_bgra=True,
-                    )
-                    if not false_color_data:
-                        logger.debug("False color conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        false_color_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    result = qimage.copy()
-                    del false_color_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                # BGRA matches ARGB32 on little-endian (B,G,R,A byte order)
-                qimage = QImage(frame_data, width, height, line_stride, QImage.Format.Format_ARGB32)
-                result = qimage.copy()  # Own the data
-                del frame_data
-                del qimage
-                return result
-
-            # Fallback: RGBA path
-            if video_frame.FourCC == ndi.FOURCC_VIDEO_TYPE_RGBA:
-                if hasattr(video_frame.data, "tobytes"):
-                    frame_data = video_frame.data.tobytes()
-                elif hasattr(video_frame.data, "__array__"):
-                    import numpy as np
-
-                    frame_data = bytes(np.array(video_frame.data).flatten())
-                else:
-                    frame_data = bytes(video_frame.data)
-
-                expected_size = line_stride * height
-                if len(frame_data) < expected_size:
-                    logger.debug(f"Frame data too small: {len(frame_data)} < {expected_size}")
-                    return None
-
-                if self.waveform_enabled:
-                    waveform_data = self._waveform_from_rgbx(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                        is_bgra=False,
-                    )
-                    if not waveform_data:
-                        logger.debug("Waveform conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        waveform_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_waveform_image(qimage)
-                    result = qimage.copy()
-                    del waveform_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.vectorscope_enabled:
-                    vectorscope_data = self._vectorscope_from_rgbx(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                        is_bgra=False,
-                    )
-                    if not vectorscope_data:
-                        logger.debug("Vectorscope conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        vectorscope_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_vectorscope_image(qimage)
-                    result = qimage.copy()
-                    del vectorscope_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.rgb_parade_enabled:
-                    rgb_parade_data = self._rgb_parade_from_rgbx(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                        is_bgra=False,
-                    )
-                    if not rgb_parade_data:
-                        logger.debug("RGB parade conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        rgb_parade_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_rgb_parade_image(qimage)
-                    result = qimage.copy()
-                    del rgb_parade_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.histogram_enabled:
-                    histogram_data = self._histogram_from_rgbx(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                        is_bgra=False,
-                    )
-                    if not histogram_data:
-                        logger.debug("Histogram conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        histogram_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_histogram_image(qimage)
-                    result = qimage.copy()
-                    del histogram_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.false_color_enabled:
-                    false_color_data = self._false_color_from_rgbx(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                        is_bgra=False,
-                    )
-                    if not false_color_data:
-                        logger.debug("False color conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        false_color_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    result = qimage.copy()
-                    del false_color_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                qimage = QImage(
-                    frame_data, width, height, line_stride, QImage.Format.Format_RGBA8888
+            handler = self._fourcc_handlers.get(video_frame.FourCC)
+            if handler is None:
+                # Unsupported format
+                logger.debug(
+                    f"Unsupported video format: {video_frame.FourCC} (expected BGRA, RGBA, or UYVY)"
                 )
-                result = qimage.copy()
-                del frame_data
-                del qimage
-                return result
-
-            # Fallback: UYVY path (legacy)
-            if video_frame.FourCC == ndi.FOURCC_VIDEO_TYPE_UYVY:
-                # Get frame data as bytes - handle different data types
-                if hasattr(video_frame.data, "tobytes"):
-                    frame_data = video_frame.data.tobytes()
-                elif hasattr(video_frame.data, "__array__"):
-                    import numpy as np
-
-                    frame_data = bytes(np.array(video_frame.data).flatten())
-                else:
-                    frame_data = bytes(video_frame.data)
-
-                expected_size = line_stride * height
-                if len(frame_data) < expected_size:
-                    logger.debug(f"Frame data too small: {len(frame_data)} < {expected_size}")
-                    return None
-
-                if self.waveform_enabled:
-                    waveform_data = self._waveform_from_uyvy(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                    )
-                    if not waveform_data:
-                        logger.debug("Waveform conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        waveform_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_waveform_image(qimage)
-                    result = qimage.copy()
-                    del waveform_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.vectorscope_enabled:
-                    vectorscope_data = self._vectorscope_from_uyvy(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                    )
-                    if not vectorscope_data:
-                        logger.debug("Vectorscope conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        vectorscope_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_vectorscope_image(qimage)
-                    result = qimage.copy()
-                    del vectorscope_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.rgb_parade_enabled:
-                    rgb_parade_data = self._rgb_parade_from_uyvy(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                    )
-                    if not rgb_parade_data:
-                        logger.debug("RGB parade conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        rgb_parade_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_rgb_parade_image(qimage)
-                    result = qimage.copy()
-                    del rgb_parade_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.histogram_enabled:
-                    histogram_data = self._histogram_from_uyvy(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                    )
-                    if not histogram_data:
-                        logger.debug("Histogram conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        histogram_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    self._annotate_histogram_image(qimage)
-                    result = qimage.copy()
-                    del histogram_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                if self.false_color_enabled:
-                    false_color_data = self._false_color_from_uyvy(
-                        frame_data,
-                        width,
-                        height,
-                        line_stride,
-                    )
-                    if not false_color_data:
-                        logger.debug("False color conversion returned empty data")
-                        return None
-
-                    qimage = QImage(
-                        false_color_data, width, height, width * 3, QImage.Format.Format_RGB888
-                    )
-                    result = qimage.copy()
-                    del false_color_data
-                    del frame_data
-                    del qimage
-                    return result
-
-                # Convert UYVY to RGB
-                rgb_data = self._uyvy_to_rgb(frame_data, width, height, line_stride)
-                if not rgb_data:
-                    logger.debug("RGB conversion returned empty data")
-                    return None
-
-                qimage = QImage(rgb_data, width, height, width * 3, QImage.Format.Format_RGB888)
-                result = qimage.copy()
-                del rgb_data
-                del frame_data
-                del qimage
-                return result
-
-            # Unsupported format
-            logger.debug(
-                f"Unsupported video format: {video_frame.FourCC} (expected BGRA, RGBA, or UYVY)"
-            )
-            return None
+                return None
+            return handler(video_frame)
 
         except (ValueError, TypeError, MemoryError, AttributeError):
             import traceback
@@ -1465,6 +1465,180 @@ class NDIVideoThread(QThread):
             traceback.print_exc()
             return None
 
+    def _build_fourcc_handlers(self) -> None:
+        """Map each supported NDI FourCC to its converter (NDI must be loaded)"""
+        self._fourcc_handlers = {
+            ndi.FOURCC_VIDEO_TYPE_BGRA: self._convert_bgra,
+            ndi.FOURCC_VIDEO_TYPE_RGBA: self._convert_rgba,
+            ndi.FOURCC_VIDEO_TYPE_UYVY: self._convert_uyvy,
+        }
+
+    def _frame_bytes(self, video_frame, expected_size: int) -> bytes | None:
+        """Return the frame payload as bytes, or None if it is shorter than expected_size"""
+        if self._extract_bytes is None:
+            self._extract_bytes = self._bytes_extractor(video_frame.data)
+        frame_data = self._extract_bytes(video_frame)
+
+        if len(frame_data) < expected_size:
+            logger.debug(f"Frame data too small: {len(frame_data)} < {expected_size}")
+            return None
+        return frame_data
+
+    @staticmethod
+    def _bytes_extractor(data):
+        """Pick how to get bytes from a frame payload of this type"""
+        if hasattr(data, "tobytes"):
+            return lambda video_frame: video_frame.data.tobytes()
+        if hasattr(data, "__array__"):
+            import numpy as np
+
+            return lambda video_frame: np.asarray(video_frame.data).tobytes()
+        return lambda video_frame: bytes(video_frame.data)
+
+    def _scope_image(self, scope_data, width: int, height: int, label: str, annotate=None):
+        """Wrap rendered RGB888 scope or false color data in an owned QImage"""
+        if not scope_data:
+            logger.debug(f"{label} conversion returned empty data")
+            return None
+        qimage = QImage(scope_data, width, height, width * 3, QImage.Format.Format_RGB888)
+        if annotate is not None:
+            annotate(qimage)
+        return qimage.copy()
+
+    def _convert_bgra(self, video_frame) -> QImage | None:
+        """Native BGRA path - matches Qt's ARGB32 on little-endian Windows"""
+        return self._convert_rgbx(video_frame, QImage.Format.Format_ARGB32, is_bgra=True)
+
+    def _convert_rgba(self, video_frame) -> QImage | None:
+        """Fallback: RGBA path"""
+        return self._convert_rgbx(video_frame, QImage.Format.Format_RGBA8888, is_bgra=False)
+
+    def _convert_rgbx(self, video_frame, image_format, is_bgra: bool) -> QImage | None:
+        """Convert a 4-byte-per-pixel frame (BGRA or RGBA) to QImage"""
+        width = video_frame.xres
+        height = video_frame.yres
+        line_stride = video_frame.line_stride_in_bytes
+
+        direct = self._copy_frame_direct(video_frame, width, height, image_format)
+        if direct is not None:
+            return direct
+
+        frame_data = self._frame_bytes(video_frame, line_stride * height)
+        if frame_data is None:
+            return None
+
+        if self.waveform_enabled:
+            return self._scope_image(
+                self._waveform_from_rgbx(frame_data, width, height, line_stride, is_bgra=is_bgra),
+                width,
+                height,
+                "Waveform",
+                self._annotate_waveform_image,
+            )
+        if self.vectorscope_enabled:
+            return self._scope_image(
+                self._vectorscope_from_rgbx(
+                    frame_data, width, height, line_stride, is_bgra=is_bgra
+                ),
+                width,
+                height,
+                "Vectorscope",
+                self._annotate_vectorscope_image,
+            )
+        if self.rgb_parade_enabled:
+            return self._scope_image(
+                self._rgb_parade_from_rgbx(frame_data, width, height, line_stride, is_bgra=is_bgra),
+                width,
+                height,
+                "RGB parade",
+                self._annotate_rgb_parade_image,
+            )
+        if self.histogram_enabled:
+            return self._scope_image(
+                self._histogram_from_rgbx(frame_data, width, height, line_stride, is_bgra=is_bgra),
+                width,
+                height,
+                "Histogram",
+                self._annotate_histogram_image,
+            )
+        if self.false_color_enabled:
+            return self._scope_image(
+                self._false_color_from_rgbx(
+                    frame_data, width, height, line_stride, is_bgra=is_bgra
+                ),
+                width,
+                height,
+                "False color",
+            )
+
+        # BGRA matches ARGB32 on little-endian (B,G,R,A byte order); RGBA is RGBA8888
+        qimage = QImage(frame_data, width, height, line_stride, image_format)
+        return qimage.copy()  # Own the data
+
+    def _convert_uyvy(self, video_frame) -> QImage | None:
+        """Fallback: UYVY path (legacy)"""
+        width = video_frame.xres
+        height = video_frame.yres
+        line_stride = video_frame.line_stride_in_bytes
+
+        frame_data = self._frame_bytes(video_frame, line_stride * height)
+        if frame_data is None:
+            return None
+
+        if self.waveform_enabled:
+            return self._scope_image(
+                self._waveform_from_uyvy(frame_data, width, height, line_stride),
+                width,
+                height,
+                "Waveform",
+                self._annotate_waveform_image,
+            )
+        if self.vectorscope_enabled:
+            return self._scope_image(
+                self._vectorscope_from_uyvy(frame_data, width, height, line_stride),
+                width,
+                height,
+                "Vectorscope",
+                self._annotate_vectorscope_image,
+            )
+        if self.rgb_parade_enabled:
+            return self._scope_image(
+                self._rgb_parade_from_uyvy(frame_data, width, height, line_stride),
+                width,
+                height,
+                "RGB parade",
+                self._annotate_rgb_parade_image,
+            )
+        if self.histogram_enabled:
+            return self._scope_image(
+                self._histogram_from_uyvy(frame_data, width, height, line_stride),
+                width,
+                height,
+                "Histogram",
+                self._annotate_histogram_image,
+            )
+        if self.false_color_enabled:
+            return self._scope_image(
+                self._false_color_from_uyvy(frame_data, width, height, line_stride),
+                width,
+                height,
+                "False color",
+            )
+
+        # Convert UYVY to RGB in the pooled buffer; the QImage copy below is the
+        # only per-frame copy of the converted image
+        try:
+            rgb_data = self._uyvy_to_rgb_array(frame_data, width, height, line_stride).data
+        except (ImportError, ValueError, AttributeError, TypeError):
+            logger.exception("NumPy conversion error")
+            rgb_data = self._uyvy_to_rgb_slow(frame_data, width, height, line_stride)
+        if not rgb_data:
+            logger.debug("RGB conversion returned empty data")
+            return None
+
+        qimage = QImage(rgb_data, width, height, width * 3, QImage.Format.Format_RGB888)
+        return qimage.copy()
+
     def _ensure_false_color_tables(self) -> None:
         """Initialize threshold and palette tables for Atomos-style false color mapping."""
         if self._false_color_thresholds is not None and self._false_color_palette is not None:
@@ -1872,13 +2046,7 @@ class NDIVideoThread(QThread):
     ) -> bytes | None:
         """Convert UYVY frame bytes to RGB parade RGB888 bytes."""
         try:
-            import numpy as np
-
-            rgb_data = self._uyvy_to_rgb(frame_data, width, height, line_stride)
-            if not rgb_data:
-                return None
-
-            rgb = np.frombuffer(rgb_data, dtype=np.uint8).reshape(height, width, 3)
+            rgb = self._uyvy_to_rgb_array(frame_data, width, height, line_stride)
             return self._rgb_parade_from_channels_u8(
                 rgb[:, :, 0],
                 rgb[:, :, 1],
@@ -2139,13 +2307,7 @@ class NDIVideoThread(QThread):
     ) -> bytes | None:
         """Convert UYVY frame bytes to histogram RGB888 bytes."""
         try:
-            import numpy as np
-
-            rgb_data = self._uyvy_to_rgb(frame_data, width, height, line_stride)
-            if not rgb_data:
-                return None
-
-            rgb = np.frombuffer(rgb_data, dtype=np.uint8).reshape(height, width, 3)
+            rgb = self._uyvy_to_rgb_array(frame_data, width, height, line_stride)
             return self._histogram_from_channels_u8(
                 rgb[:, :, 0],
                 rgb[:, :, 1],
@@ -2572,124 +2734,88 @@ class NDIVideoThread(QThread):
             logger.exception("Unexpected false color UYVY conversion error")
             return None
 
-    def _uyvy_to_rgb(self, uyvy_data: bytes, width: int, height: int, line_stride: int) -> bytes:
+    def _get_uyvy_buffers(self, height: int, width: int) -> tuple[Any, dict]:
+        """Return (rgb, working arrays) for a resolution, allocating on first use."""
+        import numpy as np
+
+        key = (height, width)
+        pool = self._uyvy_buffer_pool
+        buffers = pool.get(key)
+        if buffers is not None:
+            pool.move_to_end(key)
+            return buffers
+
+        # Working arrays are only needed by the NumPy path and are filled in on first use
+        buffers = (np.empty((height, width, 3), dtype=np.uint8), {})
+        pool[key] = buffers
+        while len(pool) > _UYVY_BUFFER_POOL_SIZE:
+            pool.popitem(last=False)
+        return buffers
+
+    def _uyvy_to_rgb_array(self, uyvy_data: bytes, width: int, height: int, line_stride: int):
         """
-        Convert UYVY422 to RGB888 using NumPy with minimal allocations.
+        Convert UYVY422 to a (height, width, 3) uint8 RGB array using NumPy with minimal allocations.
         Each UYVY macropixel (4 bytes) encodes 2 pixels: U Y0 V Y1
 
         Memory optimization: All buffers are persistent and reused across frames.
         Uses in-place operations to avoid temporary array allocations.
+        The returned array is the pooled output buffer for this resolution: it is
+        overwritten by the next conversion, so copy anything that outlives the frame.
+        Uses the fused Numba kernel instead when Numba is installed.
         """
-        try:
-            import numpy as np
+        import numpy as np
 
-            # View input as numpy array (no copy)
-            frame = np.frombuffer(uyvy_data, dtype=np.uint8)
+        # View input as numpy array (no copy)
+        frame = np.frombuffer(uyvy_data, dtype=np.uint8)
 
-            # Handle line stride
-            if line_stride != width * 2:
-                frame = frame.reshape(height, line_stride)[:, : width * 2].ravel()
+        # The kernel skips bounds checks, so only hand it a payload that covers every row
+        kernel = _get_uyvy_kernel()
+        if kernel and frame.size >= line_stride * (height - 1) + width * 2:
+            rgb = self._get_uyvy_buffers(height, width)[0]
+            kernel(frame, rgb, width, height, line_stride)
+            return rgb
 
-            # Reshape to UYVY macropixels: [height, width//2, 4]
-            uyvy = frame.reshape(height, width // 2, 4)
+        # Handle line stride
+        if line_stride != width * 2:
+            frame = frame.reshape(height, line_stride)[:, : width * 2].ravel()
 
-            # Reuse persistent RGB output buffer
-            target_shape = (height, width, 3)
-            if self._rgb_buffer is None or self._rgb_buffer_shape != target_shape:
-                self._rgb_buffer = np.empty(target_shape, dtype=np.uint8)
-                self._rgb_buffer_shape = target_shape
-            rgb = self._rgb_buffer
+        # Reshape to UYVY macropixels: [height, width//2, 4]
+        uyvy = frame.reshape(height, width // 2, 4)
 
-            # Reuse persistent working buffers for intermediate calculations
+        # Reuse persistent RGB output and working buffers for this resolution
+        rgb, work = self._get_uyvy_buffers(height, width)
+        if not work:
             work_shape = (height, width // 2)
-            if self._uyvy_work_buffers is None or self._uyvy_work_shape != work_shape:
-                # Allocate all working arrays once
-                self._uyvy_work_buffers = {
-                    "y0": np.empty(work_shape, dtype=np.float32),
-                    "y1": np.empty(work_shape, dtype=np.float32),
-                    "u": np.empty(work_shape, dtype=np.float32),
-                    "v": np.empty(work_shape, dtype=np.float32),
-                    "temp": np.empty(work_shape, dtype=np.float32),
-                }
-                self._uyvy_work_shape = work_shape
-
-            y0 = self._uyvy_work_buffers["y0"]
-            y1 = self._uyvy_work_buffers["y1"]
-            u = self._uyvy_work_buffers["u"]
-            v = self._uyvy_work_buffers["v"]
-            temp = self._uyvy_work_buffers["temp"]
-
-            # Extract channels into persistent buffers (in-place where possible)
-            np.copyto(y0, uyvy[:, :, 1])
-            np.copyto(y1, uyvy[:, :, 3])
-            np.copyto(u, uyvy[:, :, 0])
-            np.subtract(u, 128.0, out=u)
-            np.copyto(v, uyvy[:, :, 2])
-            np.subtract(v, 128.0, out=v)
-
-            # ITU-R BT.601 conversion using in-place operations
-            # R = Y + 1.402*V
-            # G = Y - 0.344*U - 0.714*V
-            # B = Y + 1.772*U
-
-            # Pixel 0 (even columns) - R channel
-            np.multiply(v, 1.402, out=temp)
-            np.add(y0, temp, out=temp)
-            np.clip(temp, 0, 255, out=temp)
-            rgb[:, 0::2, 0] = temp.astype(np.uint8)
-
-            # Pixel 0 - G channel: y0 - 0.344*u - 0.714*v
-            np.multiply(u, 0.344, out=temp)
-            np.subtract(y0, temp, out=temp)
-            np.multiply(v, 0.714, out=u)  # Reuse u as temp2 (we're done with u after this)
-            np.subtract(temp, u, out=temp)
-            np.clip(temp, 0, 255, out=temp)
-            rgb[:, 0::2, 1] = temp.astype(np.uint8)
-
-            # Restore u for remaining calculations
-            np.copyto(u, uyvy[:, :, 0])
-            np.subtract(u, 128.0, out=u)
-
-            # Pixel 0 - B channel: y0 + 1.772*u
-            np.multiply(u, 1.772, out=temp)
-            np.add(y0, temp, out=temp)
-            np.clip(temp, 0, 255, out=temp)
-            rgb[:, 0::2, 2] = temp.astype(np.uint8)
-
-            # Pixel 1 (odd columns) - R channel
-            np.multiply(v, 1.402, out=temp)
-            np.add(y1, temp, out=temp)
-            np.clip(temp, 0, 255, out=temp)
-            rgb[:, 1::2, 0] = temp.astype(np.uint8)
-
-            # Pixel 1 - G channel: y1 - 0.344*u - 0.714*v
-            np.multiply(u, 0.344, out=temp)
-            np.subtract(y1, temp, out=temp)
-            np.multiply(v, 0.714, out=u)  # Reuse u as temp2
-            np.subtract(temp, u, out=temp)
-            np.clip(temp, 0, 255, out=temp)
-            rgb[:, 1::2, 1] = temp.astype(np.uint8)
-
-            # Restore u for B channel
-            np.copyto(u, uyvy[:, :, 0])
-            np.subtract(u, 128.0, out=u)
-
-            # Pixel 1 - B channel: y1 + 1.772*u
-            np.multiply(u, 1.772, out=temp)
-            np.add(y1, temp, out=temp)
-            np.clip(temp, 0, 255, out=temp)
-            rgb[:, 1::2, 2] = temp.astype(np.uint8)
-
-            # Return copy of buffer data
-            return rgb.tobytes()
-
-        except ImportError:
-            # Fallback to simpler conversion if NumPy not available (shouldn't happen)
-            logger.warning("NumPy not available, using slow fallback")
-            return self._uyvy_to_rgb_slow(uyvy_data, width, height, line_stride)
-        except (ValueError, AttributeError, TypeError):
-            logger.exception("NumPy conversion error")
-            return self._uyvy_to_rgb_slow(uyvy_data, width, height, line_stride)
+            for name in ("dr", "dg", "db", "temp"):
+                work[name] = np.empty(work_shape, dtype=np.float32)
+        dr = work["dr"]
+        dg = work["dg"]
+        db = work["db"]
+        temp = work["temp"]
+
+        # ITU-R BT.601 conversion using in-place operations
+        # R = Y + 1.402*V
+        # G = Y - 0.344*U - 0.714*V
+        # B = Y + 1.772*U
+        # The chroma terms are shared by both pixels of a macropixel, so compute them once
+        np.subtract(uyvy[:, :, 0], 128.0, out=db, dtype=np.float32)  # U
+        np.subtract(uyvy[:, :, 2], 128.0, out=dr, dtype=np.float32)  # V
+        np.multiply(db, -0.344, out=dg)
+        np.multiply(dr, 0.714, out=temp)
+        np.subtract(dg, temp, out=dg)
+        np.multiply(dr, 1.402, out=dr)
+        np.multiply(db, 1.772, out=db)
+
+        # Y0 fills even columns and Y1 odd columns; each channel is one add, clip and
+        # truncating store straight into the RGB buffer (no astype() temporaries)
+        for luma_index, columns in ((1, slice(0, None, 2)), (3, slice(1, None, 2))):
+            luma = uyvy[:, :, luma_index]
+            for channel, delta in enumerate((dr, dg, db)):
+                np.add(luma, delta, out=temp, dtype=np.float32)
+                np.clip(temp, 0, 255, out=temp)
+                np.copyto(rgb[:, columns, channel], temp, casting="unsafe")
+
+        return rgb
 
     def _uyvy_to_rgb_slow(
         self, uyvy_data: bytes, width: int, height: int, line_stride: int
@@ -2729,6 +2855,9 @@ class NDIVideoThread(QThread):
     def _cleanup(self):
         """Clean up NDI resources - never throws exceptions"""
         try:
+            # Stop converting before the rest of the stream state is torn down
+            self._stop_conversion_worker()
+
             # DISABLED: Calling NDI DLL cleanup functions during app shutdown causes
             # Windows STACK_BUFFER_OVERRUN (exit code 0xC0000409). Windows automatically
             # frees all DLL resources on process exit. Only clear Python references.
@@ -2757,11 +2886,8 @@ class NDIVideoThread(QThread):
                 _stream_metrics_on_stop(self._metrics_connected)
                 self._metrics_started = False
 
-            # Release persistent UYVY conversion buffer
-            self._rgb_buffer = None
-            self._rgb_buffer_shape = None
-            self._uyvy_work_buffers = None
-            self._uyvy_work_shape = None
+            # Release persistent UYVY conversion buffers
+            self._uyvy_buffer_pool.clear()
             self._vectorscope_plot_buffer = None
             self._vectorscope_plot_shape = None
             self._histogram_plot_buffer = None
@@ -2786,9 +2912,6 @@ def discover_and_cache_all_sources(timeout_ms: int = None, expected_count: int =
         timeout_ms: Total timeout in milliseconds
         expected_count: Number of sources expected (will poll until found or timeout)
     """
-    global _source_cache, _last_discovery_time
-    import time
-
     if not _ensure_ndi_initialized():
         logger.warning("[NDI] Cannot discover sources - NDI not initialized")
         return 0
@@ -2798,61 +2921,56 @@ def discover_and_cache_all_sources(timeout_ms: int = None, expected_count: int =
         timeout_ms = NetworkConstants.NDI_DISCOVERY_TIMEOUT_MS
 
     try:
-        with _ndi_lock:
-            if expected_count > 0:
-                logger.info(
-                    f"[NDI] Polling for {expected_count} sources (timeout: {timeout_ms}ms)..."
-                )
-            else:
-                logger.info(f"[NDI] Discovering all sources (timeout: {timeout_ms}ms)...")
+        if expected_count > 0:
+            logger.info(f"[NDI] Polling for {expected_count} sources (timeout: {timeout_ms}ms)...")
+        else:
+            logger.info(f"[NDI] Discovering all sources (timeout: {timeout_ms}ms)...")
 
-            start_time = time.time()
-            poll_interval_ms = 200  # Poll every 200ms
+        finder = _global_finder
+        start_time = time.time()
+        poll_interval_ms = 200  # Poll every 200ms
 
-            while True:
-                # Poll for sources
-                ndi.find_wait_for_sources(_global_finder, poll_interval_ms)
-                sources = ndi.find_get_current_sources(_global_finder)
+        while True:
+            # Poll for sources
+            _wait_for_global_sources(finder, poll_interval_ms)
 
-                # Cache discovered sources
+            # Cache discovered sources
+            new_sources = {}
+            with _finder_query_lock:
+                sources = ndi.find_get_current_sources(finder)
                 for source in sources:
                     try:
-                        source_name = (
-                            source.ndi_name.decode("utf-8")
-                            if isinstance(source.ndi_name, bytes)
-                            else str(source.ndi_name)
-                        )
-                        if source_name not in _source_cache:
-                            _source_cache[source_name] = source
+                        source_name = _source_name(source)
+                        if source_name not in _source_cache and source_name not in new_sources:
+                            new_sources[source_name] = source
                             logger.info(f"[NDI Discovery] ✓ Cached source: '{source_name}'")
                     except Exception as e:
                         logger.warning(f"[NDI] Error caching source: {e}")
+            if new_sources:
+                _cache_sources(new_sources)
+
+            # Check if we found all expected sources
+            if expected_count > 0 and len(_source_cache) >= expected_count:
+                logger.info(f"[NDI] Found all {expected_count} expected sources")
+                break
+
+            # Check timeout
+            elapsed_ms = (time.time() - start_time) * 1000
+            if elapsed_ms >= timeout_ms:
+                if expected_count > 0 and len(_source_cache) < expected_count:
+                    logger.warning(
+                        f"[NDI] Timeout: Found {len(_source_cache)}/{expected_count} "
+                        f"sources after {int(elapsed_ms)}ms"
+                    )
+                break
 
-                # Check if we found all expected sources
-                if expected_count > 0 and len(_source_cache) >= expected_count:
-                    logger.info(f"[NDI] Found all {expected_count} expected sources")
-                    break
-
-                # Check timeout
-                elapsed_ms = (time.time() - start_time) * 1000
-                if elapsed_ms >= timeout_ms:
-                    if expected_count > 0 and len(_source_cache) < expected_count:
-                        logger.warning(
-                            f"[NDI] Timeout: Found {len(_source_cache)}/{expected_count} "
-                            f"sources after {int(elapsed_ms)}ms"
-                        )
-                    break
-
-                # Continue polling if we haven't found all sources yet
-                if expected_count == 0:
-                    # No expected count - just do one poll
-                    break
-
-            # Update discovery timestamp
-            _last_discovery_time = time.time()
+            # Continue polling if we haven't found all sources yet
+            if expected_count == 0:
+                # No expected count - just do one poll
+                break
 
-            logger.info(f"[NDI] Cached {len(_source_cache)} sources")
-            return len(_source_cache)
+        logger.info(f"[NDI] Cached {len(_source_cache)} sources")
+        return len(_source_cache)
 
     except Exception as e:
         logger.exception(f"[NDI] Error during source discovery: {e}")
@@ -2866,18 +2984,19 @@ def find_ndi_cameras(timeout_ms: int = 5000) -> list[str]:
 
     Note: Requires firewall to allow mDNS traffic on UDP port 5353.
     If discovery returns empty list, check firewall configuration.
-    Thread-safe: Uses lock to prevent concurrent access to global finder.
+    Thread-safe: the blocking wait runs unlocked; reading the source list is serialized.
     """
     if not _ensure_ndi_initialized():
         logger.debug("NDI not available or failed to initialize")
         return []
 
     try:
-        # Use lock to prevent concurrent access to global finder
-        with _ndi_lock:
-            # Wait for sources (this blocks!)
-            ndi.find_wait_for_sources(_global_finder, timeout_ms)
-            sources = ndi.find_get_current_sources(_global_finder)
+        finder = _global_finder
+        # Wait for sources (this blocks!)
+        _wait_for_global_sources(finder, timeout_ms)
+
+        with _finder_query_lock:
+            sources = ndi.find_get_current_sources(finder)
 
             camera_names = []
             for i, source in enumerate(sources):
@@ -137,7 +137,7 @@ class ViscaResponse:
 class ViscaConstants:
     """VISCA protocol UI constants"""
 
-    SHUTTER_SPEEDS = [
+    SHUTTER_SPEEDS = (
         "Auto",
         "Manual",
         "1/10000",
@@ -161,4 +161,6 @@ class ViscaConstants:
         "1/15",
         "1/8",
         "1/4",
-    ]
+    )
+    # Fixed speeds (after "Auto" and "Manual"), indexed by the shutter slider position
+    MANUAL_SHUTTER_SPEEDS = SHUTTER_SPEEDS[2:]
@@ -2,6 +2,7 @@
 #include <pybind11/pybind11.h>
 
 #include <atomic>
+#include <chrono>
 
 #include <Processing.NDI.Lib.h>
 
@@ -678,6 +679,61 @@ PYBIND11_MODULE(NDIlib, m) {
       },
       py::arg("instance"), py::arg("timeout_in_ms"));
 
+  // Capture and immediately free frames until duration_in_ms elapses, returning
+  // (video, none, other) counts. Used by source probes that only need to know
+  // whether video is flowing; the whole loop runs without the GIL.
+  m.def(
+      "recv_drain",
+      [](py::capsule instance, uint32_t timeout_in_ms, uint32_t duration_in_ms) {
+        auto p_instance =
+            static_cast<NDIlib_recv_instance_type *>(instance.get_pointer());
+        uint64_t video_frames = 0;
+        uint64_t none_frames = 0;
+        uint64_t other_frames = 0;
+        {
+          py::gil_scoped_release release;
+          const auto deadline = std::chrono::steady_clock::now() +
+                                std::chrono::milliseconds(duration_in_ms);
+          NDIlib_video_frame_v2_t video_frame;
+          NDIlib_audio_frame_v3_t audio_frame;
+          NDIlib_metadata_frame_t metadata_frame;
+          while (std::chrono::steady_clock::now() < deadline) {
+            auto type =
+                NDIlib_recv_capture_v3(p_instance, &video_frame, &audio_frame,
+                                       &metadata_frame, timeout_in_ms);
+            g_recv_capture_v3_calls.fetch_add(1, std::memory_order_relaxed);
+            switch (type) {
+            case NDIlib_frame_type_video:
+              g_recv_video_frames_captured.fetch_add(1, std::memory_order_relaxed);
+              NDIlib_recv_free_video_v2(p_instance, &video_frame);
+              g_recv_free_video_calls.fetch_add(1, std::memory_order_relaxed);
+              ++video_frames;
+              break;
+            case NDIlib_frame_type_audio:
+              g_recv_audio_frames_captured.fetch_add(1, std::memory_order_relaxed);
+              NDIlib_recv_free_audio_v3(p_instance, &audio_frame);
+              g_recv_free_audio_v3_calls.fetch_add(1, std::memory_order_relaxed);
+              ++other_frames;
+              break;
+            case NDIlib_frame_type_metadata:
+              g_recv_metadata_frames_captured.fetch_add(1, std::memory_order_relaxed);
+              NDIlib_recv_free_metadata(p_instance, &metadata_frame);
+              g_recv_free_metadata_calls.fetch_add(1, std::memory_order_relaxed);
+              ++other_frames;
+              break;
+            case NDIlib_frame_type_none:
+              ++none_frames;
+              break;
+            default:
+              ++other_frames;
+              break;
+            }
+          }
+        }
+        return std::make_tuple(video_frames, none_frames, other_frames);
+      },
+      py::arg("instance"), py::arg("timeout_in_ms"), py::arg("duration_in_ms"));
+
   m.def(
       "recv_free_video_v2",
       [](py::capsule instance, const NDIlib_video_frame_v2_t *p_video_data) {
@@ -26,7 +26,7 @@ from PyQt6.QtWidgets import (  # type: ignore
     QWidget,
 )
 
-from videocue.constants import HardwareConstants
+from videocue.constants import HardwareConstants, NetworkConstants
 from videocue.controllers.ndi_video import NDIVideoThread, ndi_available
 from videocue.controllers.usb_controller import MovementDirection
 from videocue.controllers.visca_commands import ViscaConstants
@@ -1234,6 +1234,7 @@ class CameraWidget(QWidget):
                 vectorscope_enabled=vectorscope_enabled,
                 rgb_parade_enabled=rgb_parade_enabled,
                 histogram_enabled=histogram_enabled,
+                frame_pool_size=NetworkConstants.NDI_FRAME_POOL_SIZE,
             )
             self.ndi_thread.frame_ready.connect(self.on_video_frame)
             self.ndi_thread.connected.connect(self.on_ndi_connected)
@@ -1304,7 +1305,11 @@ class CameraWidget(QWidget):
     @pyqtSlot(QImage)
     def on_video_frame(self, image: QImage):
         """Store latest frame only; actual rendering is timer-driven to bound UI work/memory."""
+        previous = self._latest_frame
         self._latest_frame = image
+        # A frame replaced before it was rendered goes straight back to the buffer pool
+        if previous is not None and self.ndi_thread:
+            self.ndi_thread.release_frame(previous)
 
     def _render_latest_frame(self):
         """Render latest available frame at bounded cadence."""
@@ -1320,8 +1325,13 @@ class CameraWidget(QWidget):
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.FastTransformation,
         )
+        if scaled_image.cacheKey() == image.cacheKey():
+            # Same size: scaled() shared the pooled buffer, which is about to be reused
+            scaled_image = image.copy()
         self._display_pixmap.convertFromImage(scaled_image)
         self.video_label.setPixmap(self._display_pixmap)
+        if self.ndi_thread:
+            self.ndi_thread.release_frame(image)
 
         # Explicitly release references to help GC
         del scaled_image
@@ -1404,8 +1414,6 @@ class CameraWidget(QWidget):
 
         # Auto-retry connection after delay (only once automatically)
         if not hasattr(self, "_auto_retry_attempted") or not self._auto_retry_attempted:
-            from videocue.constants import NetworkConstants
-
             logger.info(
                 f"[{self._format_camera_display_name()}] Scheduling auto-retry in {NetworkConstants.NDI_CONNECTION_RETRY_DELAY_MS}ms..."
             )
@@ -1608,7 +1616,7 @@ class CameraWidget(QWidget):
             self.shutter_slider.blockSignals(True)
             self.shutter_slider.setValue(results["shutter"])
             self.shutter_slider.blockSignals(False)
-            speeds = ViscaConstants.SHUTTER_SPEEDS[2:]
+            speeds = ViscaConstants.MANUAL_SHUTTER_SPEEDS
             if results["shutter"] < len(speeds):
                 self.shutter_value_label.setText(speeds[results["shutter"]])
 
@@ -1755,7 +1763,7 @@ class CameraWidget(QWidget):
             self.shutter_slider.setValue(shutter_value)
             self.shutter_slider.blockSignals(False)
             # Update label using constant list
-            speeds = ViscaConstants.SHUTTER_SPEEDS[2:]  # Skip "Auto" and "Manual"
+            speeds = ViscaConstants.MANUAL_SHUTTER_SPEEDS
             if shutter_value < len(speeds):
                 self.shutter_value_label.setText(speeds[shutter_value])
 
@@ -2076,8 +2084,7 @@ class CameraWidget(QWidget):
 
     def on_shutter_changed(self, value: int) -> None:
         """Handle shutter slider change"""
-        # Use constant list, skipping "Auto" and "Manual" entries
-        speeds = ViscaConstants.SHUTTER_SPEEDS[2:]
+        speeds = ViscaConstants.MANUAL_SHUTTER_SPEEDS
         if value < len(speeds):
             self.shutter_value_label.setText(speeds[value])
         else:
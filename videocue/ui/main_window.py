@@ -19,6 +19,7 @@ from PyQt6.QtGui import (  # type: ignore
     QShortcut,
 )
 from PyQt6.QtWidgets import (  # type: ignore
+    QApplication,
     QHBoxLayout,
     QHeaderView,
     QMainWindow,
@@ -103,10 +104,11 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        # Set window icon
-        icon_path = resource_path("resources/icon.png")
-        if Path(icon_path).exists():
-            self.setWindowIcon(QIcon(icon_path))
+        # Set window icon (top-level windows inherit the application icon when it is set)
+        if QApplication.windowIcon().isNull():
+            icon_path = resource_path("resources/icon.png")
+            if Path(icon_path).exists():
+                self.setWindowIcon(QIcon(icon_path))
 
         # Configuration manager
         self.config = ConfigManager()
@@ -9,6 +9,7 @@ class UIStrings:
 
     # Application
     APP_NAME = "VideoCue"
+    SPLASH_STARTING = "Starting..."
 
     # Camera Status
     STATUS_NO_VIDEO = "No Video"
@@ -2,12 +2,14 @@
 Utility functions for VideoCue application
 """
 
+import functools
 import os
 import re
 import sys
 from pathlib import Path
 
 
+@functools.cache
 def resource_path(relative_path: str) -> str:
     """
     Get absolute path to resource, works for dev and for PyInstaller.
@@ -28,12 +30,14 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)  # noqa: PTH118
 
 
+@functools.cache
 def get_app_data_dir() -> Path:
     """
     Get application data directory.
 
     Returns:
-        Path to application data directory (creates if doesn't exist)
+        Path to application data directory (created on the first call; the result
+        is cached for the life of the process)
         - Windows: %LOCALAPPDATA%/VideoCue
         - Unix: ~/.config/VideoCue
     """